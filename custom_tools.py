@@ -6,11 +6,320 @@ in agent farm configurations.
 """
 
 from crewai.tools import BaseTool
-from crewai_tools import SerperDevTool
-from typing import Type, Any, List
+from pydantic import PrivateAttr
+from typing import Type, Any, List, Dict, Tuple, Optional
+from collections import OrderedDict, deque
 import os
 import ast
-import subprocess
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+
+
+def _env_number(name: str, default: Any, cast: Type = float) -> Any:
+    """Read a numeric setting from the environment, falling back to the default if unset or malformed."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        print(f"⚠️  [SEARCH] Ignoring invalid {name}={raw!r}, using {default}")
+        return default
+
+
+# Process-wide cache of raw search results shared by every LimitedSearchTool,
+# so agents in a pod asking the same question don't re-hit the Serper API.
+_SEARCH_CACHE: Dict[str, Tuple[float, Any]] = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+_SEARCH_CACHE_MAX_ENTRIES = 512
+_SEARCH_CACHE_TTL = _env_number("ORKAS_SEARCH_TTL", 300.0)
+
+
+def _search_cache_key(query: str, n_results: int) -> str:
+    """Build a cache key from the normalized query and result count."""
+    normalized = f"{n_results}:{query.strip().lower()}"
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_search(key: str) -> Optional[Any]:
+    """Return cached raw results for a key, or None if missing or expired."""
+    # Agents search concurrently, so lookups, expiry and LRU reordering must not interleave
+    with _SEARCH_CACHE_LOCK:
+        entry = _SEARCH_CACHE.get(key)
+        if entry is not None:
+            stored_at, results = entry
+            if time.monotonic() - stored_at > _SEARCH_CACHE_TTL:
+                del _SEARCH_CACHE[key]
+                return None
+            
+            _SEARCH_CACHE.move_to_end(key)
+            return results
+    
+    return _load_persisted_search(key)
+
+
+def _remember_search(key: str, stored_at: float, results: Any):
+    """Put results in the in-memory cache, evicting the least recently used entries."""
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[key] = (stored_at, results)
+        _SEARCH_CACHE.move_to_end(key)
+        while len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX_ENTRIES:
+            _SEARCH_CACHE.popitem(last=False)
+
+
+def _store_cached_search(key: str, results: Any):
+    """Store freshly fetched results in memory and on disk."""
+    _remember_search(key, time.monotonic(), results)
+    _persist_search(key, results)
+
+
+# On-disk copy of the search cache so results survive restarts between pod
+# runs. Set ORKAS_SEARCH_CACHE_DB to an empty string to disable it.
+_SEARCH_CACHE_DB_PATH = os.getenv("ORKAS_SEARCH_CACHE_DB", "~/.cache/orkasai/search_cache.db")
+# Results on disk outlive the in-memory TTL so they are still useful after a restart
+_SEARCH_CACHE_DB_TTL = _env_number("ORKAS_SEARCH_DISK_TTL", 86400.0)
+_SEARCH_CACHE_DB_LOCK = threading.Lock()
+_search_cache_db: Optional[sqlite3.Connection] = None
+_search_cache_db_failed = False
+
+
+def _get_search_cache_db() -> Optional[sqlite3.Connection]:
+    """Open the persistent search cache on first use, or None if unavailable."""
+    global _search_cache_db, _search_cache_db_failed
+    if _search_cache_db is not None or _search_cache_db_failed or not _SEARCH_CACHE_DB_PATH:
+        return _search_cache_db
+    
+    try:
+        db_path = os.path.expanduser(_SEARCH_CACHE_DB_PATH)
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        connection = sqlite3.connect(db_path, timeout=5, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache (key TEXT PRIMARY KEY, stored_at REAL, results TEXT)"
+        )
+        # Drop expired rows so the file doesn't grow across runs
+        connection.execute(
+            "DELETE FROM search_cache WHERE stored_at < ?", (time.time() - _SEARCH_CACHE_DB_TTL,)
+        )
+        connection.commit()
+        _search_cache_db = connection
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️  [SEARCH] Persistent search cache disabled: {e}")
+        _search_cache_db_failed = True
+    
+    return _search_cache_db
+
+
+def _load_persisted_search(key: str) -> Optional[Any]:
+    """Load unexpired results from the persistent cache into memory."""
+    with _SEARCH_CACHE_DB_LOCK:
+        connection = _get_search_cache_db()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT stored_at, results FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    
+    if row is None:
+        return None
+    
+    if time.time() - row[0] > _SEARCH_CACHE_DB_TTL:
+        return None
+    
+    try:
+        results = json.loads(row[1])
+    except ValueError:
+        # A corrupt row is treated as a miss and overwritten by the next fetch
+        return None
+    
+    _remember_search(key, time.monotonic(), results)
+    return results
+
+
+def _persist_search(key: str, results: Any):
+    """Write results to the persistent cache, skipping non-JSON payloads."""
+    try:
+        payload = json.dumps(results)
+    except (TypeError, ValueError):
+        return
+    
+    with _SEARCH_CACHE_DB_LOCK:
+        connection = _get_search_cache_db()
+        if connection is None:
+            return
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO search_cache (key, stored_at, results) VALUES (?, ?, ?)",
+                (key, time.time(), payload)
+            )
+            connection.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️  [SEARCH] Failed to persist search results: {e}")
+
+
+# Queries currently being fetched, so concurrent agents asking the same thing
+# wait for one Serper round-trip instead of each issuing their own
+_INFLIGHT_SEARCHES: Dict[str, threading.Event] = {}
+_INFLIGHT_LOCK = threading.Lock()
+_INFLIGHT_WAIT_TIMEOUT = 60
+
+
+def _claim_inflight_search(key: str) -> bool:
+    """Mark a query as in flight; False if another thread is already fetching it."""
+    with _INFLIGHT_LOCK:
+        if key in _INFLIGHT_SEARCHES:
+            return False
+        _INFLIGHT_SEARCHES[key] = threading.Event()
+        return True
+
+
+def _wait_for_inflight_search(key: str) -> Optional[Any]:
+    """Wait for another thread's fetch of a query and return its cached results."""
+    with _INFLIGHT_LOCK:
+        event = _INFLIGHT_SEARCHES.get(key)
+    if event is not None:
+        event.wait(_INFLIGHT_WAIT_TIMEOUT)
+    return _get_cached_search(key)
+
+
+def _release_inflight_search(key: str):
+    """Clear the in-flight marker for a query and wake any waiting threads."""
+    with _INFLIGHT_LOCK:
+        event = _INFLIGHT_SEARCHES.pop(key, None)
+    if event is not None:
+        event.set()
+
+
+# Search budget shared by every LimitedSearchTool in the process. Per-tool
+# limits still apply; ORKAS_SEARCH_GLOBAL_MAX (0 = unlimited) caps the total
+# number of Serper requests across all agents in one pod run.
+_SEARCH_BUDGET_LOCK = threading.Lock()
+_SEARCH_BUDGET = {"requests": 0}
+_SEARCH_GLOBAL_MAX = _env_number("ORKAS_SEARCH_GLOBAL_MAX", 0, int)
+
+
+def reset_search_budget():
+    """Start a new pod run with the full shared search budget."""
+    with _SEARCH_BUDGET_LOCK:
+        _SEARCH_BUDGET["requests"] = 0
+
+
+_JSON_PAYLOAD_RE = re.compile(r'\s*[\[{]')
+_SEARCH_LIMIT_MESSAGE = "Search limit reached. Used {}/{} searches. Please work with existing information."
+_SEARCH_LIMIT_WARNING = "\n\n⚠️ SEARCH LIMIT REACHED: No more searches allowed. Work with this information."
+
+
+# SerperDevTool clients shared across LimitedSearchTool instances (keyed by
+# result count) so every agent reuses the same HTTP connection pool
+_SHARED_SERPER_TOOLS: Dict[int, Any] = {}
+_SHARED_SERPER_LOCK = threading.Lock()
+
+
+def _get_shared_serper(n_results: int) -> Any:
+    """Return the process-wide SerperDevTool for a result count, creating it once."""
+    # crewai_tools pulls in many dependencies, so only import it once a search runs
+    from crewai_tools import SerperDevTool
+    
+    with _SHARED_SERPER_LOCK:
+        search_tool = _SHARED_SERPER_TOOLS.get(n_results)
+        if search_tool is None:
+            search_tool = SerperDevTool(n_results=n_results)
+            _SHARED_SERPER_TOOLS[n_results] = search_tool
+            print(f"✅ [SEARCH] SerperDevTool initialized with n_results={n_results}")
+        return search_tool
+
+
+# Finished Python analysis reports keyed by the SHA-256 of the source, so code
+# that agents resubmit is neither re-parsed nor re-walked
+_PYTHON_REPORT_CACHE: Dict[bytes, str] = OrderedDict()
+_PYTHON_REPORT_CACHE_MAX_ENTRIES = 256
+_PYTHON_REPORT_CACHE_LOCK = threading.Lock()
+
+
+def _python_source_digest(code: str) -> bytes:
+    """Hash Python source for the report cache."""
+    return hashlib.sha256(code.encode('utf-8', 'surrogatepass')).digest()
+
+
+# Number of potential issues listed in a Python code analysis report
+_MAX_REPORTED_ISSUES = 10
+
+# Counter slots for the node kinds reported by CodeAnalysisTool; related node
+# types (sync/async functions, Import/ImportFrom, For/While) share a slot
+_FUNCTIONS, _CLASSES, _IMPORTS, _IF_STATEMENTS, _LOOPS, _TRY_BLOCKS = range(6)
+_NODE_KIND_COUNT = 6
+_NODE_KINDS = {
+    ast.FunctionDef: _FUNCTIONS,
+    ast.AsyncFunctionDef: _FUNCTIONS,
+    ast.ClassDef: _CLASSES,
+    ast.Import: _IMPORTS,
+    ast.ImportFrom: _IMPORTS,
+    ast.If: _IF_STATEMENTS,
+    ast.For: _LOOPS,
+    ast.While: _LOOPS,
+    ast.Try: _TRY_BLOCKS
+}
+
+# Pre-rendered report labels for the complexity section
+_COMPLEXITY_LABELS = (
+    ('If Statements', _IF_STATEMENTS),
+    ('Loops', _LOOPS),
+    ('Try Blocks', _TRY_BLOCKS)
+)
+
+# Node types that can contain statements; expression subtrees never do
+_STATEMENT_CONTAINERS = (ast.mod, ast.stmt, ast.excepthandler)
+if hasattr(ast, 'match_case'):
+    _STATEMENT_CONTAINERS += (ast.match_case,)
+
+
+def _walk_statements(tree: ast.AST):
+    """Breadth-first walk like ast.walk, skipping expression subtrees."""
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _STATEMENT_CONTAINERS):
+                todo.append(child)
+        yield node
+
+
+def _has_docstring(node: ast.AST) -> bool:
+    """Check for a non-blank docstring without ast.get_docstring's cleanup work."""
+    body = node.body
+    if not body or type(body[0]) is not ast.Expr:
+        return False
+    value = body[0].value
+    return type(value) is ast.Constant and isinstance(value.value, str) and bool(value.value.strip())
+
+
+# Keyword groups detected by CodeAnalysisTool in non-Python code, matched as
+# whole words against the lowercased tokens of the source
+_GENERIC_CODE_KEYWORDS = {
+    'function_keywords': frozenset(['function', 'def', 'func', 'method', 'procedure']),
+    'class_keywords': frozenset(['class', 'interface', 'struct']),
+    'control_flow': frozenset(['if', 'else', 'while', 'for', 'switch', 'case'])
+}
+# Reverse index so one pass over the tokens tallies every group at once
+_KEYWORD_GROUPS = {
+    keyword: pattern_type
+    for pattern_type, keywords in _GENERIC_CODE_KEYWORDS.items()
+    for keyword in keywords
+}
+_PATTERN_LABELS = {
+    pattern_type: pattern_type.replace('_', ' ').title()
+    for pattern_type in _GENERIC_CODE_KEYWORDS
+}
+_WORD_RE = re.compile(r'\w+')
+_COMMENT_PREFIXES = ('//', '#', '/*', '*')
 
 
 class LimitedSearchTool(BaseTool):
@@ -22,67 +331,128 @@ class LimitedSearchTool(BaseTool):
     max_length: int = 400
     max_searches: int = 2
     
+    # Per-instance runtime state, kept out of the validated model fields
+    _search_count: int = PrivateAttr(default=0)
+    # Shared SerperDevTool, resolved lazily - it will get API key from environment
+    _search_tool: Optional[Any] = PrivateAttr(default=None)
+    
     def __init__(self, max_results: int = 3, max_length: int = 400, max_searches: int = 2, **kwargs):
-        super().__init__(**kwargs)
-        self.max_results = max_results
-        self.max_length = max_length
-        self.max_searches = max_searches
-        self.search_count = 0
-        # Initialize the SerperDevTool - it will get API key from environment
-        self._search_tool = None
+        # Limits are validated once as model fields rather than reassigned afterwards
+        super().__init__(max_results=max_results, max_length=max_length, max_searches=max_searches, **kwargs)
     
     def _run(self, query: str) -> str:
         """Execute search with strict limits"""
         try:
-            # Check search count limit
-            if self.search_count >= self.max_searches:
-                print(f"🚫 [SEARCH] Search limit reached ({self.max_searches} searches used)")
-                return f"Search limit reached. Used {self.search_count}/{self.max_searches} searches. Please work with existing information."
+            # Repeated queries are served from cache and don't count against the limit
+            cache_key = _search_cache_key(query, self.max_results)
+            raw_results = _get_cached_search(cache_key)
+            owns_query = False
             
-            # Increment search count
-            self.search_count += 1
+            if raw_results is None:
+                # Out of budget and nothing cached: bail out before touching shared state
+                if self._search_count >= self.max_searches:
+                    return self._tool_limit_message()
+                
+                # If another agent is already running this query, wait for its results
+                owns_query = _claim_inflight_search(cache_key)
+                if not owns_query:
+                    raw_results = _wait_for_inflight_search(cache_key)
             
-            # Lazy initialize the search tool
-            if self._search_tool is None:
+            from_cache = raw_results is not None
+            if not from_cache:
                 try:
-                    self._search_tool = SerperDevTool(n_results=self.max_results)
-                    print(f"✅ [SEARCH] SerperDevTool initialized with n_results={self.max_results}")
-                except Exception as e:
-                    print(f"❌ [SEARCH] Failed to initialize SerperDevTool: {str(e)}")
-                    return f"❌ Search tool initialization failed: {str(e)}"
-            
-            print(f"🔍 [SEARCH] Search {self.search_count}/{self.max_searches}: {query}")
-            print(f"🔧 [SEARCH] Limits: max {self.max_results} results, {self.max_length} chars each")
-            
-            # Get raw results
-            raw_results = self._search_tool.run(query)
-            
-            print(f"✅ [SEARCH] Search completed successfully")
+                    # Check and consume the search budget atomically
+                    limit_message = self._reserve_search()
+                    if limit_message:
+                        return limit_message
+                    
+                    # Lazy initialize the search tool
+                    if self._search_tool is None:
+                        try:
+                            self._search_tool = _get_shared_serper(self.max_results)
+                        except Exception as e:
+                            print(f"❌ [SEARCH] Failed to initialize SerperDevTool: {str(e)}")
+                            return f"❌ Search tool initialization failed: {str(e)}"
+                    
+                    print(f"🔍 [SEARCH] Search {self._search_count}/{self.max_searches}: {query} (max {self.max_results} results, {self.max_length} chars each)")
+                    
+                    # Get raw results
+                    raw_results = self._search_tool.run(query)
+                    _store_cached_search(cache_key, raw_results)
+                finally:
+                    if owns_query:
+                        _release_inflight_search(cache_key)
             
             # Process and limit results
+            budget = self.max_length * self.max_results
+            if isinstance(raw_results, str) and _JSON_PAYLOAD_RE.match(raw_results):
+                # Stringified JSON: decode it so only the kept items get formatted
+                try:
+                    raw_results = json.loads(raw_results)
+                except ValueError:
+                    pass
+            
             if isinstance(raw_results, str):
-                # If it's already a string, truncate it
-                limited_results = raw_results[:self.max_length * self.max_results]
-                print(f"📊 [SEARCH] Processed {len(limited_results)} characters from string results")
-                
-                if self.search_count >= self.max_searches:
-                    limited_results += f"\n\n⚠️ SEARCH LIMIT REACHED: No more searches allowed. Work with this information."
-                
-                return f"🔍 Search Results (#{self.search_count}, limited to {self.max_results} results):\n\n{limited_results}"
+                # If it's already a string, truncate it only when it exceeds the budget
+                limited_text = raw_results if len(raw_results) <= budget else raw_results[:budget]
+                summary = f"{len(limited_text)} characters from string results"
+            else:
+                # Structured results: format only the items we keep instead of the whole payload
+                items = raw_results.get('organic') if isinstance(raw_results, dict) else raw_results
+                if isinstance(items, list):
+                    limited_text = self._format_result_items(items)
+                    summary = f"{min(len(items), self.max_results)} results ({len(limited_text)} characters)"
+                else:
+                    # Fallback: convert to string and limit
+                    limited_text = str(raw_results)[:budget]
+                    summary = f"{len(limited_text)} characters from object results"
             
-            # Fallback: convert to string and limit
-            result_str = str(raw_results)
-            limited_text = result_str[:self.max_length * self.max_results]
-            print(f"📊 [SEARCH] Processed {len(limited_text)} characters from object results")
+            # One summary line per call keeps stdout quiet when many agents search
+            if from_cache:
+                print(f"♻️  [SEARCH] Cache hit: {query} -> {summary}")
+            else:
+                print(f"✅ [SEARCH] Search completed -> {summary}")
             
-            if self.search_count >= self.max_searches:
-                limited_text += f"\n\n⚠️ SEARCH LIMIT REACHED: No more searches allowed. Work with this information."
+            if self._search_count >= self.max_searches:
+                limited_text += _SEARCH_LIMIT_WARNING
             
-            return f"🔍 Search Results (#{self.search_count}, limited to {self.max_results} results):\n\n{limited_text}"
+            return f"🔍 Search Results (#{self._search_count}, limited to {self.max_results} results):\n\n{limited_text}"
             
         except Exception as e:
             print(f"❌ [SEARCH] Search failed with error: {str(e)}")
             return f"❌ Search failed: {str(e)}"
+    
+    def _tool_limit_message(self) -> str:
+        """Report that this tool has used up its own search budget."""
+        print(f"🚫 [SEARCH] Search limit reached ({self.max_searches} searches used)")
+        return _SEARCH_LIMIT_MESSAGE.format(self._search_count, self.max_searches)
+    
+    def _reserve_search(self) -> Optional[str]:
+        """Count a search against the tool and global budgets, or return the limit message."""
+        with _SEARCH_BUDGET_LOCK:
+            if self._search_count >= self.max_searches:
+                return self._tool_limit_message()
+            
+            if _SEARCH_GLOBAL_MAX and _SEARCH_BUDGET["requests"] >= _SEARCH_GLOBAL_MAX:
+                print(f"🚫 [SEARCH] Global search limit reached ({_SEARCH_GLOBAL_MAX} searches used)")
+                return f"Search limit reached. The pod has used all {_SEARCH_GLOBAL_MAX} shared searches. Please work with existing information."
+            
+            self._search_count += 1
+            _SEARCH_BUDGET["requests"] += 1
+            return None
+    
+    def _format_result_items(self, items: List[Any]) -> str:
+        """Format the first max_results search hits as compact Markdown entries."""
+        entries = []
+        for item in items[:self.max_results]:
+            if isinstance(item, dict):
+                title = item.get('title', 'Untitled')
+                link = item.get('link', '')
+                snippet = str(item.get('snippet', ''))[:self.max_length]
+                entries.append(f"**{title}** ({link})\n{snippet}")
+            else:
+                entries.append(str(item)[:self.max_length])
+        return "\n\n".join(entries)
 
 
 class CodeAnalysisTool(BaseTool):
@@ -102,55 +472,70 @@ class CodeAnalysisTool(BaseTool):
             return f"Error analyzing code: {str(e)}"
     
     def _analyze_python_code(self, code: str) -> str:
-        """Analyze Python code specifically."""
+        """Analyze Python code specifically, reusing reports for repeated sources."""
+        digest = _python_source_digest(code)
+        with _PYTHON_REPORT_CACHE_LOCK:
+            report = _PYTHON_REPORT_CACHE.get(digest)
+            if report is not None:
+                _PYTHON_REPORT_CACHE.move_to_end(digest)
+                return report
+        
+        # Built outside the lock so concurrent agents don't wait on each other's analysis
+        report = self._build_python_report(code)
+        with _PYTHON_REPORT_CACHE_LOCK:
+            _PYTHON_REPORT_CACHE[digest] = report
+            if len(_PYTHON_REPORT_CACHE) > _PYTHON_REPORT_CACHE_MAX_ENTRIES:
+                _PYTHON_REPORT_CACHE.popitem(last=False)
+        return report
+    
+    def _build_python_report(self, code: str) -> str:
+        """Parse and analyze Python source into a report."""
         analysis = []
         
         try:
             # Parse the code
             tree = ast.parse(code)
             
-            # Count different elements
-            functions = len([n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)])
-            classes = len([n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)])
-            imports = len([n for n in ast.walk(tree) if isinstance(n, (ast.Import, ast.ImportFrom))])
-            
-            analysis.append(f"📊 Code Structure Analysis:")
-            analysis.append(f"   • Functions: {functions}")
-            analysis.append(f"   • Classes: {classes}")
-            analysis.append(f"   • Import statements: {imports}")
-            
-            # Check for common issues
-            issues = []
+            # Collect every count and issue in a single walk over the statements
+            counts = [0] * _NODE_KIND_COUNT
+            long_functions = []
+            missing_docstrings = []
             
-            # Check for long functions (simple heuristic)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
+            for node in _walk_statements(tree):
+                kind = _NODE_KINDS.get(type(node))
+                if kind is None:
+                    continue
+                counts[kind] += 1
+                
+                # Only the first _MAX_REPORTED_ISSUES of each kind can ever be reported
+                if kind == _FUNCTIONS and len(long_functions) < _MAX_REPORTED_ISSUES:
+                    # Check for long functions (simple heuristic)
                     if hasattr(node, 'lineno') and hasattr(node, 'end_lineno'):
                         length = node.end_lineno - node.lineno
                         if length > 50:
-                            issues.append(f"Function '{node.name}' is very long ({length} lines)")
+                            long_functions.append(f"Function '{node.name}' is very long ({length} lines)")
+                
+                if (kind == _FUNCTIONS or kind == _CLASSES) and len(missing_docstrings) < _MAX_REPORTED_ISSUES:
+                    # Check for missing docstrings
+                    if not _has_docstring(node):
+                        label = 'Function' if kind == _FUNCTIONS else 'Class'
+                        missing_docstrings.append(f"{label} '{node.name}' missing docstring")
+            
+            analysis.append(f"📊 Code Structure Analysis:")
+            analysis.append(f"   • Functions: {counts[_FUNCTIONS]}")
+            analysis.append(f"   • Classes: {counts[_CLASSES]}")
+            analysis.append(f"   • Import statements: {counts[_IMPORTS]}")
             
-            # Check for missing docstrings
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                    if not ast.get_docstring(node):
-                        issues.append(f"{node.__class__.__name__.replace('Def', '')} '{node.name}' missing docstring")
+            # Check for common issues
+            issues = long_functions + missing_docstrings
             
             if issues:
                 analysis.append(f"\n⚠️  Potential Issues:")
-                for issue in issues[:10]:  # Limit to first 10 issues
-                    analysis.append(f"   • {issue}")
+                analysis.extend(f"   • {issue}" for issue in issues[:_MAX_REPORTED_ISSUES])
             
             # Basic complexity estimation
-            complexity_indicators = {
-                'if_statements': len([n for n in ast.walk(tree) if isinstance(n, ast.If)]),
-                'loops': len([n for n in ast.walk(tree) if isinstance(n, (ast.For, ast.While))]),
-                'try_blocks': len([n for n in ast.walk(tree) if isinstance(n, ast.Try)])
-            }
-            
             analysis.append(f"\n🧮 Complexity Indicators:")
-            for indicator, count in complexity_indicators.items():
-                analysis.append(f"   • {indicator.replace('_', ' ').title()}: {count}")
+            analysis.extend(f"   • {label}: {counts[kind]}" for label, kind in _COMPLEXITY_LABELS)
             
         except SyntaxError as e:
             analysis.append(f"❌ Syntax Error: {e}")
@@ -162,26 +547,97 @@ class CodeAnalysisTool(BaseTool):
         lines = code.split('\n')
         analysis = []
         
+        # Count non-empty and comment lines in one pass
+        non_empty = 0
+        comments = 0
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            non_empty += 1
+            if stripped.startswith(_COMMENT_PREFIXES):
+                comments += 1
+        
         analysis.append(f"📊 General Code Analysis ({language}):")
         analysis.append(f"   • Total lines: {len(lines)}")
-        analysis.append(f"   • Non-empty lines: {len([l for l in lines if l.strip()])}")
-        analysis.append(f"   • Comment lines: {len([l for l in lines if l.strip().startswith(('//','#','/*','*'))])}")
+        analysis.append(f"   • Non-empty lines: {non_empty}")
+        analysis.append(f"   • Comment lines: {comments}")
         
-        # Basic pattern detection
-        patterns = {
-            'function_keywords': ['function', 'def', 'func', 'method', 'procedure'],
-            'class_keywords': ['class', 'interface', 'struct'],
-            'control_flow': ['if', 'else', 'while', 'for', 'switch', 'case']
-        }
+        # Basic pattern detection: tokenize once and tally all groups in a single pass
+        pattern_counts = dict.fromkeys(_GENERIC_CODE_KEYWORDS, 0)
+        for token in _WORD_RE.findall(code.lower()):
+            pattern_type = _KEYWORD_GROUPS.get(token)
+            if pattern_type is not None:
+                pattern_counts[pattern_type] += 1
         
         analysis.append(f"\n🔍 Pattern Detection:")
-        for pattern_type, keywords in patterns.items():
-            count = sum(1 for line in lines for keyword in keywords if keyword in line.lower())
-            analysis.append(f"   • {pattern_type.replace('_', ' ').title()}: {count}")
+        for pattern_type, count in pattern_counts.items():
+            analysis.append(f"   • {_PATTERN_LABELS[pattern_type]}: {count}")
         
         return "\n".join(analysis)
 
 
+# Static recommendation blocks returned by DataAnalysisTool
+_DESCRIPTIVE_RECOMMENDATIONS = (
+    "\n📊 Descriptive Analysis Recommendations:",
+    "   • Calculate central tendency measures (mean, median, mode)",
+    "   • Determine variability measures (standard deviation, range)",
+    "   • Identify outliers and anomalies",
+    "   • Generate frequency distributions",
+    "   • Create summary statistics tables",
+    "\n💡 Insights to look for:",
+    "   • Data distribution patterns",
+    "   • Missing or inconsistent values",
+    "   • Unusual patterns or anomalies",
+    "   • Key performance indicators"
+)
+
+_STATISTICAL_RECOMMENDATIONS = (
+    "\n📈 Statistical Analysis Recommendations:",
+    "   • Perform hypothesis testing",
+    "   • Calculate correlation coefficients",
+    "   • Conduct regression analysis",
+    "   • Apply significance testing",
+    "   • Generate confidence intervals",
+    "\n🔬 Advanced techniques to consider:",
+    "   • ANOVA for group comparisons",
+    "   • Chi-square tests for categorical data",
+    "   • Time series analysis for temporal data",
+    "   • Multivariate analysis for complex relationships"
+)
+
+_TREND_RECOMMENDATIONS = (
+    "\n📈 Trend Analysis Recommendations:",
+    "   • Identify seasonal patterns",
+    "   • Calculate growth rates and trends",
+    "   • Detect cyclical behaviors",
+    "   • Forecast future values",
+    "   • Analyze trend significance",
+    "\n🔮 Forecasting considerations:",
+    "   • Moving averages for smoothing",
+    "   • Exponential smoothing techniques",
+    "   • ARIMA models for complex patterns",
+    "   • Confidence intervals for predictions"
+)
+
+_BASIC_RECOMMENDATIONS = (
+    "\n📋 Basic Analysis Recommendations:",
+    "   • Review data quality and completeness",
+    "   • Understand data structure and format",
+    "   • Identify key variables and relationships",
+    "   • Create initial visualizations",
+    "   • Document findings and observations"
+)
+
+# Lowercased analysis type -> DataAnalysisTool method producing its section;
+# looked up by name so subclasses can override the individual analyses
+_DATA_ANALYSIS_METHODS = {
+    "descriptive": "_descriptive_analysis",
+    "statistical": "_statistical_analysis",
+    "trend": "_trend_analysis"
+}
+
+
 class DataAnalysisTool(BaseTool):
     """Tool for analyzing data and generating insights."""
     
@@ -191,19 +647,16 @@ class DataAnalysisTool(BaseTool):
     def _run(self, data_description: str, analysis_type: str = "descriptive") -> str:
         """Perform data analysis based on description."""
         try:
-            analysis = []
-            
-            analysis.append(f"📈 Data Analysis Report")
-            analysis.append(f"Data: {data_description}")
-            analysis.append(f"Analysis Type: {analysis_type}")
-            analysis.append("=" * 50)
+            analysis = [
+                "📈 Data Analysis Report",
+                f"Data: {data_description}",
+                f"Analysis Type: {analysis_type}",
+                "=" * 50,
+            ]
             
-            if analysis_type.lower() == "descriptive":
-                analysis.extend(self._descriptive_analysis(data_description))
-            elif analysis_type.lower() == "statistical":
-                analysis.extend(self._statistical_analysis(data_description))
-            elif analysis_type.lower() == "trend":
-                analysis.extend(self._trend_analysis(data_description))
+            method_name = _DATA_ANALYSIS_METHODS.get(analysis_type.lower())
+            if method_name is not None:
+                analysis.extend(getattr(self, method_name)(data_description))
             else:
                 analysis.append("⚠️  Unknown analysis type. Performing basic analysis.")
                 analysis.extend(self._basic_analysis(data_description))
@@ -213,64 +666,79 @@ class DataAnalysisTool(BaseTool):
         except Exception as e:
             return f"Error in data analysis: {str(e)}"
     
-    def _descriptive_analysis(self, data_description: str) -> List[str]:
+    def _descriptive_analysis(self, data_description: str) -> Tuple[str, ...]:
         """Generate descriptive analysis suggestions."""
-        return [
-            "\n📊 Descriptive Analysis Recommendations:",
-            "   • Calculate central tendency measures (mean, median, mode)",
-            "   • Determine variability measures (standard deviation, range)",
-            "   • Identify outliers and anomalies",
-            "   • Generate frequency distributions",
-            "   • Create summary statistics tables",
-            "\n💡 Insights to look for:",
-            "   • Data distribution patterns",
-            "   • Missing or inconsistent values",
-            "   • Unusual patterns or anomalies",
-            "   • Key performance indicators"
-        ]
-    
-    def _statistical_analysis(self, data_description: str) -> List[str]:
+        return _DESCRIPTIVE_RECOMMENDATIONS
+    
+    def _statistical_analysis(self, data_description: str) -> Tuple[str, ...]:
         """Generate statistical analysis suggestions."""
-        return [
-            "\n📈 Statistical Analysis Recommendations:",
-            "   • Perform hypothesis testing",
-            "   • Calculate correlation coefficients",
-            "   • Conduct regression analysis",
-            "   • Apply significance testing",
-            "   • Generate confidence intervals",
-            "\n🔬 Advanced techniques to consider:",
-            "   • ANOVA for group comparisons",
-            "   • Chi-square tests for categorical data",
-            "   • Time series analysis for temporal data",
-            "   • Multivariate analysis for complex relationships"
-        ]
-    
-    def _trend_analysis(self, data_description: str) -> List[str]:
+        return _STATISTICAL_RECOMMENDATIONS
+    
+    def _trend_analysis(self, data_description: str) -> Tuple[str, ...]:
         """Generate trend analysis suggestions."""
-        return [
-            "\n📈 Trend Analysis Recommendations:",
-            "   • Identify seasonal patterns",
-            "   • Calculate growth rates and trends",
-            "   • Detect cyclical behaviors",
-            "   • Forecast future values",
-            "   • Analyze trend significance",
-            "\n🔮 Forecasting considerations:",
-            "   • Moving averages for smoothing",
-            "   • Exponential smoothing techniques",
-            "   • ARIMA models for complex patterns",
-            "   • Confidence intervals for predictions"
-        ]
-    
-    def _basic_analysis(self, data_description: str) -> List[str]:
+        return _TREND_RECOMMENDATIONS
+    
+    def _basic_analysis(self, data_description: str) -> Tuple[str, ...]:
         """Generate basic analysis suggestions."""
-        return [
-            "\n📋 Basic Analysis Recommendations:",
-            "   • Review data quality and completeness",
-            "   • Understand data structure and format",
-            "   • Identify key variables and relationships",
-            "   • Create initial visualizations",
-            "   • Document findings and observations"
-        ]
+        return _BASIC_RECOMMENDATIONS
+
+
+# Chart suggestions as (trigger substrings, charts) rules, matched against the
+# lowercased data type and analysis goal respectively
+_DATA_TYPE_CHART_RULES = (
+    (("time", "temporal"), (
+        "Line Chart - Show trends over time",
+        "Area Chart - Show cumulative changes",
+        "Candlestick Chart - For financial data"
+    )),
+    (("categorical", "category"), (
+        "Bar Chart - Compare categories",
+        "Pie Chart - Show proportions (max 5-7 categories)",
+        "Donut Chart - Alternative to pie chart"
+    )),
+    (("numerical", "continuous"), (
+        "Histogram - Show distribution",
+        "Box Plot - Show quartiles and outliers",
+        "Scatter Plot - Show relationships"
+    ))
+)
+
+_ANALYSIS_GOAL_CHART_RULES = (
+    (("comparison",), (
+        "Bar Chart - Direct comparison",
+        "Radar Chart - Multi-dimensional comparison",
+        "Parallel Coordinates - Complex comparisons"
+    )),
+    (("correlation", "relationship"), (
+        "Scatter Plot - Show correlation",
+        "Correlation Matrix Heatmap - Multiple relationships",
+        "Bubble Chart - Three-dimensional relationships"
+    )),
+    (("distribution",), (
+        "Histogram - Frequency distribution",
+        "Violin Plot - Distribution shape",
+        "Q-Q Plot - Compare with theoretical distribution"
+    ))
+)
+
+# Static advice returned by ChartGenerationTool
+_VISUALIZATION_TIPS = (
+    "Use color meaningfully and consistently",
+    "Keep titles and labels clear and descriptive",
+    "Choose appropriate scales and ranges",
+    "Avoid chart junk and unnecessary decorations",
+    "Consider your audience when choosing complexity",
+    "Use consistent styling across related charts",
+    "Ensure accessibility with color-blind friendly palettes"
+)
+
+_CHART_TOOL_SUGGESTIONS = (
+    "Python: matplotlib, seaborn, plotly, altair",
+    "R: ggplot2, plotly, lattice",
+    "JavaScript: D3.js, Chart.js, Highcharts",
+    "Online: Tableau Public, Google Charts, Canva",
+    "Desktop: Excel, Tableau Desktop, Power BI"
+)
 
 
 class ChartGenerationTool(BaseTool):
@@ -282,33 +750,30 @@ class ChartGenerationTool(BaseTool):
     def _run(self, data_type: str, analysis_goal: str, data_description: str = "") -> str:
         """Generate chart recommendations."""
         try:
-            recommendations = []
-            
-            recommendations.append(f"📊 Chart Recommendations")
-            recommendations.append(f"Data Type: {data_type}")
-            recommendations.append(f"Analysis Goal: {analysis_goal}")
-            recommendations.append("=" * 50)
+            recommendations = [
+                "📊 Chart Recommendations",
+                f"Data Type: {data_type}",
+                f"Analysis Goal: {analysis_goal}",
+                "=" * 50,
+            ]
             
             # Chart recommendations based on data type and goal
             charts = self._get_chart_recommendations(data_type, analysis_goal)
             
             if charts:
                 recommendations.append(f"\n🎨 Recommended Chart Types:")
-                for chart in charts:
-                    recommendations.append(f"   • {chart}")
+                recommendations.extend(f"   • {chart}" for chart in charts)
             
             # Additional visualization tips
             tips = self._get_visualization_tips(data_type, analysis_goal)
             if tips:
                 recommendations.append(f"\n💡 Visualization Tips:")
-                for tip in tips:
-                    recommendations.append(f"   • {tip}")
+                recommendations.extend(f"   • {tip}" for tip in tips)
             
             # Tool suggestions
             tools = self._get_tool_suggestions()
             recommendations.append(f"\n🛠️  Recommended Tools:")
-            for tool in tools:
-                recommendations.append(f"   • {tool}")
+            recommendations.extend(f"   • {tool}" for tool in tools)
             
             return "\n".join(recommendations)
             
@@ -319,71 +784,26 @@ class ChartGenerationTool(BaseTool):
         """Get specific chart recommendations."""
         charts = []
         
-        data_type = data_type.lower()
-        analysis_goal = analysis_goal.lower()
-        
-        if "time" in data_type or "temporal" in data_type:
-            charts.extend([
-                "Line Chart - Show trends over time",
-                "Area Chart - Show cumulative changes",
-                "Candlestick Chart - For financial data"
-            ])
-        
-        if "categorical" in data_type or "category" in data_type:
-            charts.extend([
-                "Bar Chart - Compare categories",
-                "Pie Chart - Show proportions (max 5-7 categories)",
-                "Donut Chart - Alternative to pie chart"
-            ])
-        
-        if "numerical" in data_type or "continuous" in data_type:
-            charts.extend([
-                "Histogram - Show distribution",
-                "Box Plot - Show quartiles and outliers",
-                "Scatter Plot - Show relationships"
-            ])
+        # Lowercase each input once; every rule below matches against these copies
+        rule_inputs = (
+            (_DATA_TYPE_CHART_RULES, data_type.lower()),
+            (_ANALYSIS_GOAL_CHART_RULES, analysis_goal.lower())
+        )
         
-        if "comparison" in analysis_goal:
-            charts.extend([
-                "Bar Chart - Direct comparison",
-                "Radar Chart - Multi-dimensional comparison",
-                "Parallel Coordinates - Complex comparisons"
-            ])
-        
-        if "correlation" in analysis_goal or "relationship" in analysis_goal:
-            charts.extend([
-                "Scatter Plot - Show correlation",
-                "Correlation Matrix Heatmap - Multiple relationships",
-                "Bubble Chart - Three-dimensional relationships"
-            ])
-        
-        if "distribution" in analysis_goal:
-            charts.extend([
-                "Histogram - Frequency distribution",
-                "Violin Plot - Distribution shape",
-                "Q-Q Plot - Compare with theoretical distribution"
-            ])
+        for rules, text in rule_inputs:
+            for triggers, rule_charts in rules:
+                # Stop matching once the report's six slots are filled
+                if len(charts) >= 6:
+                    return charts[:6]
+                if any(trigger in text for trigger in triggers):
+                    charts.extend(rule_charts)
         
         return charts[:6]  # Limit to top 6 recommendations
     
-    def _get_visualization_tips(self, data_type: str, analysis_goal: str) -> List[str]:
+    def _get_visualization_tips(self, data_type: str, analysis_goal: str) -> Tuple[str, ...]:
         """Get visualization best practices."""
-        return [
-            "Use color meaningfully and consistently",
-            "Keep titles and labels clear and descriptive",
-            "Choose appropriate scales and ranges",
-            "Avoid chart junk and unnecessary decorations",
-            "Consider your audience when choosing complexity",
-            "Use consistent styling across related charts",
-            "Ensure accessibility with color-blind friendly palettes"
-        ]
-    
-    def _get_tool_suggestions(self) -> List[str]:
+        return _VISUALIZATION_TIPS
+    
+    def _get_tool_suggestions(self) -> Tuple[str, ...]:
         """Get tool suggestions for creating charts."""
-        return [
-            "Python: matplotlib, seaborn, plotly, altair",
-            "R: ggplot2, plotly, lattice",
-            "JavaScript: D3.js, Chart.js, Highcharts",
-            "Online: Tableau Public, Google Charts, Canva",
-            "Desktop: Excel, Tableau Desktop, Power BI"
-        ]
+        return _CHART_TOOL_SUGGESTIONS
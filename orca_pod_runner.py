@@ -11,29 +11,144 @@ how our AI agents collaborate to achieve complex tasks.
 
 import yaml
 import importlib
-from typing import Dict, List, Any, Optional
+import functools
+import hashlib
+import sys
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Iterator, NamedTuple, Tuple, TYPE_CHECKING
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
 import os
+import threading
 import time
 from datetime import datetime, timedelta
 
-from crewai import Agent, Task, Crew, LLM
 import warnings
 
+# crewai (and litellm behind it) is slow to import, so it is only imported
+# when a crew is actually built; list/info/timing never pay for it
+if TYPE_CHECKING:
+    from crewai import Agent, Task, Crew, LLM
+
 try:
-    from progress_callbacks import VerboseProgressCallback, SimpleProgressCallback
+    # libyaml-backed loader: same safe subset, much faster tokenizing
+    from yaml import CSafeLoader as _SafeLoader
 except ImportError:
-    # Fallback if progress_callbacks not available
-    VerboseProgressCallback = None
-    SimpleProgressCallback = None
+    # PyYAML was built without libyaml; make the silent slowdown visible
+    from yaml import SafeLoader as _SafeLoader
+    print("⚠️  libyaml not available, using the slower pure-Python YAML parser", file=sys.stderr)
 warnings.filterwarnings('ignore')
 
+# Parsed YAML configs are pickled here, keyed by path and validated against
+# the file's mtime and size; set ORKAS_YAML_CACHE_DIR to an empty value to disable
+_YAML_CACHE_DIR = os.getenv(
+    'ORKAS_YAML_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'orkasai', 'yaml')
+)
+
+
+# In-process layer in front of the disk cache, keyed by (resolved path, mtime_ns, size).
+# Entries hold pickled bytes so every caller gets its own copy of the config
+_YAML_MEMORY_CACHE = OrderedDict()
+_YAML_MEMORY_CACHE_MAX = 100
+_YAML_MEMORY_LOCK = threading.Lock()
+_YAML_CACHE_ENABLED = True
+
+
+def disable_yaml_cache():
+    """Parse every YAML file from scratch for the rest of the process."""
+    global _YAML_CACHE_ENABLED
+    _YAML_CACHE_ENABLED = False
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, reusing the pickled parse while the file is unchanged."""
+    if not _YAML_CACHE_ENABLED:
+        with open(path, 'rb') as file:
+            return yaml.load(file, Loader=_SafeLoader)
+    
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    resolved_path = str(Path(path).resolve())
+    memory_key = (resolved_path, stamp)
+    
+    with _YAML_MEMORY_LOCK:
+        blob = _YAML_MEMORY_CACHE.get(memory_key)
+        if blob is not None:
+            _YAML_MEMORY_CACHE.move_to_end(memory_key)
+    if blob is not None:
+        return pickle.loads(blob)
+    
+    data = _load_yaml_from_disk_cache(path, resolved_path, stamp)
+    
+    blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    with _YAML_MEMORY_LOCK:
+        _YAML_MEMORY_CACHE[memory_key] = blob
+        if len(_YAML_MEMORY_CACHE) > _YAML_MEMORY_CACHE_MAX:
+            _YAML_MEMORY_CACHE.popitem(last=False)
+    
+    return data
+
+
+def _load_yaml_from_disk_cache(path: Path, resolved_path: str, stamp: Tuple[int, int]) -> Any:
+    """Load a YAML file through the on-disk pickle cache, parsing it on a miss."""
+    if not _YAML_CACHE_DIR:
+        with open(path, 'rb') as file:
+            return yaml.load(file, Loader=_SafeLoader)
+    
+    path_key = hashlib.sha256(resolved_path.encode('utf-8')).hexdigest()
+    cache_file = os.path.join(_YAML_CACHE_DIR, f"{path_key}.pkl")
+    
+    try:
+        with open(cache_file, 'rb') as cached:
+            cached_stamp, data = pickle.load(cached)
+        if cached_stamp == stamp:
+            return data
+    except Exception:
+        # Missing, stale-format or corrupt cache entries just fall through to a parse
+        pass
+    
+    with open(path, 'rb') as file:
+        data = yaml.load(file, Loader=_SafeLoader)
+    
+    try:
+        os.makedirs(_YAML_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, 'wb') as cached:
+            pickle.dump((stamp, data), cached, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The cache is an optimization only; a read-only home must not break loading
+        pass
+    
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_tool_class(module_name: str, class_name: str):
+    """Resolve a tool class once per process, skipping the import machinery when loaded."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+# Built registries keyed by (resolved tools config path, mtime_ns, size), so
+# new loaders in the same process reuse already-instantiated tools
+_TOOL_REGISTRY_CACHE: Dict[tuple, 'ToolRegistry'] = {}
+
 
 class ToolRegistry:
     """Registry for managing and loading tools dynamically."""
     
     def __init__(self):
         self.tools = {}
+        # Tools are only imported and instantiated the first time a pod asks for them
+        self._pending = {}
+        # Environment variables the registered configs resolved, and their values
+        self.env_snapshot = {}
     
     def register_tool(self, name: str, tool_config: Dict[str, Any]):
         """Register a tool from configuration."""
@@ -42,20 +157,15 @@ class ToolRegistry:
             class_name = tool_config['class']
             config = tool_config.get('config', {})
             
-            # Import the module
-            module = importlib.import_module(module_name)
-            tool_class = getattr(module, class_name)
-            
-            # Initialize the tool with config
+            # Resolve the init kwargs now so missing env vars are reported up front
+            init_kwargs = {}
             if config:
-                # Handle environment variable references
-                init_kwargs = {}
                 for key, value in config.items():
                     if isinstance(value, str) and value.endswith('_env'):
-                        # This is an environment variable reference
-                        import os
-                        env_var = value.replace('_env', '').upper()
+                        # This is an environment variable reference; strip just the suffix
+                        env_var = value[:-4].upper()
                         env_value = os.getenv(env_var)
+                        self.env_snapshot[env_var] = env_value
                         if env_value:
                             init_kwargs[key] = env_value
                         else:
@@ -66,9 +176,25 @@ class ToolRegistry:
                             return
                     else:
                         init_kwargs[key] = value
-                tool_instance = tool_class(**init_kwargs)
-            else:
-                tool_instance = tool_class()
+            
+            self._pending[name] = (module_name, class_name, init_kwargs)
+            self.tools.pop(name, None)
+            
+        except Exception as e:
+            print(f"❌ Failed to register tool {name}: {e}")
+            print(f"🔄 Fallback: Agent will use built-in knowledge instead")
+            self.tools[name] = None
+    
+    def _instantiate_tool(self, name: str):
+        """Import and instantiate a registered tool on first use."""
+        module_name, class_name, init_kwargs = self._pending.pop(name)
+        
+        try:
+            # Import the module and resolve the class (cached across registries)
+            tool_class = _cached_tool_class(module_name, class_name)
+            
+            # Initialize the tool with config
+            tool_instance = tool_class(**init_kwargs)
             
             self.tools[name] = tool_instance
             print(f"✅ Registered tool: {name}")
@@ -77,9 +203,17 @@ class ToolRegistry:
             print(f"❌ Failed to register tool {name}: {e}")
             print(f"🔄 Fallback: Agent will use built-in knowledge instead")
             self.tools[name] = None
+        
+        return self.tools[name]
+    
+    def matches_environment(self) -> bool:
+        """Check that every environment variable the tools resolved is unchanged."""
+        return all(os.getenv(env_var) == value for env_var, value in self.env_snapshot.items())
     
     def get_tool(self, name: str):
         """Get a tool instance by name."""
+        if name in self._pending:
+            return self._instantiate_tool(name)
         return self.tools.get(name)
     
     def get_tools(self, tool_names: List[str]) -> List:
@@ -92,13 +226,190 @@ class ToolRegistry:
         return tools
 
 
+# Keys create_agents/create_tasks index directly, checked once when a pod is parsed
+_REQUIRED_AGENT_KEYS = ('role', 'goal', 'backstory')
+_REQUIRED_TASK_KEYS = ('description', 'expected_output', 'agent')
+
+
+def _validate_pod_config(pod_config: Any) -> List[str]:
+    """Check a parsed pod file in one walk, returning every problem found."""
+    if not isinstance(pod_config, dict):
+        return [f"expected a mapping at the top level, got {type(pod_config).__name__}"]
+    
+    problems = []
+    for section, required_keys in (('agents', _REQUIRED_AGENT_KEYS), ('tasks', _REQUIRED_TASK_KEYS)):
+        entries = pod_config.get(section, {})
+        if not isinstance(entries, dict):
+            problems.append(f"'{section}' must be a mapping")
+            continue
+        for entry_name, entry in entries.items():
+            if not isinstance(entry, dict):
+                problems.append(f"{section}.{entry_name} must be a mapping")
+                continue
+            missing = [key for key in required_keys if key not in entry]
+            if missing:
+                problems.append(f"{section}.{entry_name} is missing {', '.join(missing)}")
+    
+    inputs = pod_config.get('inputs', {})
+    if not isinstance(inputs, dict):
+        problems.append("'inputs' must be a mapping")
+    else:
+        for kind in ('required', 'optional'):
+            entries = inputs.get(kind, [])
+            if not isinstance(entries, list):
+                problems.append(f"inputs.{kind} must be a list")
+                continue
+            for index, entry in enumerate(entries):
+                if not isinstance(entry, dict) or 'name' not in entry:
+                    problems.append(f"inputs.{kind}[{index}] is missing name")
+    
+    return problems
+
+
+class PodMeta(NamedTuple):
+    """Summary fields of a pod config, extracted once when the pod is parsed."""
+    name: str
+    description: str
+    agents: Tuple[str, ...]
+    tasks: Tuple[str, ...]
+    enabled_tools: Tuple[str, ...]
+    disabled_tools: Tuple[str, ...]
+    required_inputs: Tuple[str, ...]
+    optional_inputs: Tuple[str, ...]
+    timeout: int
+    estimated_minutes: int
+    complexity: str
+
+
+def _estimate_minutes(agents_count: int, tools_count: int) -> int:
+    """Estimate completion time in minutes based on pod complexity."""
+    # Base time per agent/task
+    base_time = 3  # 3 minutes per agent
+    tool_time = tools_count * 2  # 2 minutes per tool
+    complexity_multiplier = 1.2 if agents_count > 5 else 1.0
+    
+    estimated = (agents_count * base_time + tool_time) * complexity_multiplier
+    return max(5, int(estimated))  # Minimum 5 minutes
+
+
+def _complexity_level(agents_count: int, tools_count: int) -> str:
+    """Assess pod complexity level for timing predictions."""
+    if agents_count == 1 and tools_count <= 2:
+        return "Simple"
+    elif agents_count <= 3 and tools_count <= 5:
+        return "Moderate"
+    elif agents_count <= 6 and tools_count <= 8:
+        return "Complex"
+    else:
+        return "Ultra-Complex"
+
+
+def _build_pod_meta(pod_name: str, pod_config: Dict[str, Any]) -> PodMeta:
+    """Extract the summary fields used by listing, info and timing views."""
+    tools = pod_config.get('tools', {})
+    inputs = pod_config.get('inputs', {})
+    agents = tuple(pod_config.get('agents', {}))
+    enabled_tools = tuple(tools.get('enabled', []))
+    return PodMeta(
+        name=pod_config.get('name', pod_name),
+        description=pod_config.get('description', 'No description'),
+        agents=agents,
+        tasks=tuple(pod_config.get('tasks', {})),
+        enabled_tools=enabled_tools,
+        disabled_tools=tuple(tools.get('disabled', [])),
+        required_inputs=tuple(inp['name'] for inp in inputs.get('required', [])),
+        optional_inputs=tuple(inp['name'] for inp in inputs.get('optional', [])),
+        timeout=pod_config.get('timeout', 1800),
+        # Timing estimates only depend on the config, so work them out once here
+        estimated_minutes=_estimate_minutes(len(agents), len(enabled_tools)),
+        complexity=_complexity_level(len(agents), len(enabled_tools))
+    )
+
+
+class LazyPodConfigs(Mapping):
+    """Read-only mapping of pod name to config that parses each file on first access."""
+    
+    def __init__(self, pod_files: Dict[str, Path]):
+        self._files = dict(pod_files)
+        self._configs = {}
+        self._meta = {}
+    
+    def __getitem__(self, pod_name: str) -> Dict[str, Any]:
+        config = self._configs.get(pod_name)
+        if config is None:
+            if pod_name not in self._files:
+                raise KeyError(pod_name)
+            self._store(self._load_one_pod(self._files[pod_name]))
+            # A file that failed to parse has been dropped by _store
+            config = self._configs[pod_name]
+        return config
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._files))
+    
+    def __len__(self) -> int:
+        return len(self._files)
+    
+    def meta(self, pod_name: str) -> PodMeta:
+        """Get the pod's precomputed summary, parsing the pod if needed."""
+        meta = self._meta.get(pod_name)
+        if meta is None:
+            meta = _build_pod_meta(pod_name, self[pod_name])
+            self._meta[pod_name] = meta
+        return meta
+    
+    def load_all(self):
+        """Parse every pod file not loaded yet, in parallel."""
+        pending = [pod_file for pod_name, pod_file in self._files.items() if pod_name not in self._configs]
+        if not pending:
+            return
+        
+        # Read and parse the files in parallel, then report in file order;
+        # a single file isn't worth spinning up a pool for
+        if len(pending) == 1:
+            results = [self._load_one_pod(pending[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                results = list(executor.map(self._load_one_pod, pending))
+        
+        for result in results:
+            self._store(result)
+    
+    def _store(self, result):
+        """Record a parse result, dropping pods whose file failed to load."""
+        pod_file, pod_config, error = result
+        pod_name = pod_file.stem  # filename without extension
+        
+        if error is not None:
+            print(f"❌ Error loading pod {pod_file}: {error}")
+            self._files.pop(pod_name, None)
+            return
+        
+        self._configs[pod_name] = pod_config
+        print(f"✅ Loaded pod: {pod_name} ({pod_config.get('name', 'Unnamed Pod')})")
+    
+    @staticmethod
+    def _load_one_pod(pod_file: Path):
+        """Parse a single pod file, returning (path, config, error)."""
+        try:
+            pod_config = _load_yaml_cached(pod_file)
+        except Exception as e:
+            return pod_file, None, e
+        
+        # Reject malformed pods here instead of deep inside create_crew
+        problems = _validate_pod_config(pod_config)
+        if problems:
+            return pod_file, None, "; ".join(problems)
+        return pod_file, pod_config, None
+
+
 class OrcaPodLoader:
     """Loads and manages orca pod configurations from separate YAML files."""
     
     def __init__(self, pods_dir: str = "pods", tools_config: str = "tools.yaml"):
         self.pods_dir = Path(pods_dir)
         self.tools_config = Path(tools_config)
-        self.pods = {}
+        self.pods = LazyPodConfigs({})
         self.tool_registry = ToolRegistry()
         self.load_tools()
         self.load_pods()
@@ -106,14 +417,24 @@ class OrcaPodLoader:
     def load_tools(self):
         """Load the global tools configuration."""
         try:
-            with open(self.tools_config, 'r') as file:
-                tools_config = yaml.safe_load(file)
+            stat = os.stat(self.tools_config)
+            cache_key = (str(self.tools_config.resolve()), stat.st_mtime_ns, stat.st_size)
+            
+            # Reuse the registry built for this exact file, unless an env var it resolved changed
+            cached_registry = _TOOL_REGISTRY_CACHE.get(cache_key)
+            if cached_registry is not None and cached_registry.matches_environment():
+                self.tool_registry = cached_registry
+                print(f"✅ Loaded tools configuration from {self.tools_config}")
+                return
+            
+            tools_config = _load_yaml_cached(self.tools_config)
             
             # Register all tools
             if 'tools' in tools_config:
                 for tool_name, tool_config in tools_config['tools'].items():
                     self.tool_registry.register_tool(tool_name, tool_config)
             
+            _TOOL_REGISTRY_CACHE[cache_key] = self.tool_registry
             print(f"✅ Loaded tools configuration from {self.tools_config}")
             
         except FileNotFoundError:
@@ -127,85 +448,88 @@ class OrcaPodLoader:
             print(f"❌ Pods directory {self.pods_dir} does not exist")
             return
         
-        pod_files = list(self.pods_dir.glob("*.yaml")) + list(self.pods_dir.glob("*.yml"))
+        # One directory pass; .yml files sort after .yaml so they win on a shared stem
+        with os.scandir(self.pods_dir) as entries:
+            pod_files = sorted(
+                (Path(entry.path) for entry in entries
+                 if entry.name.endswith(('.yaml', '.yml')) and entry.is_file()),
+                key=lambda pod_file: pod_file.suffix == '.yml'
+            )
         
-        for pod_file in pod_files:
-            try:
-                with open(pod_file, 'r') as file:
-                    pod_config = yaml.safe_load(file)
-                
-                pod_name = pod_file.stem  # filename without extension
-                self.pods[pod_name] = pod_config
-                
-                print(f"✅ Loaded pod: {pod_name} ({pod_config.get('name', 'Unnamed Pod')})")
-                
-            except Exception as e:
-                print(f"❌ Error loading pod {pod_file}: {e}")
+        # Only index the files here; each pod is parsed the first time it is used
+        self.pods = LazyPodConfigs({pod_file.stem: pod_file for pod_file in pod_files})
         
-        print(f"\n🐋 Total pods loaded: {len(self.pods)}")
+        print(f"\n🐋 Total pods found: {len(self.pods)}")
     
     def list_pods(self):
         """List all available pods with details."""
+        self.pods.load_all()
+        
         if not self.pods:
             print("❌ No pods available")
             return
         
-        print("\n🐋 Available Orca Pods:")
-        print("=" * 60)
+        # Collect the whole listing and write it in one go
+        lines = ["\n🐋 Available Orca Pods:", "=" * 60]
         
-        for pod_name, pod_config in self.pods.items():
-            print(f"\n📋 {pod_config.get('name', pod_name)}")
-            print(f"   {pod_config.get('description', 'No description available')}")
+        for pod_name in self.pods:
+            meta = self.pods.meta(pod_name)
+            lines.append(f"\n📋 {meta.name}")
+            lines.append(f"   {self.pods[pod_name].get('description', 'No description available')}")
             
             # List agents (orcas)
-            agents = list(pod_config.get('agents', {}).keys())
-            if agents:
-                print(f"   🐋 Orcas: {', '.join(agents)}")
+            if meta.agents:
+                lines.append(f"   🐋 Orcas: {', '.join(meta.agents)}")
             
             # List tasks  
-            tasks = list(pod_config.get('tasks', {}).keys())
-            if tasks:
-                print(f"   📋 Tasks: {', '.join(tasks)}")
+            if meta.tasks:
+                lines.append(f"   📋 Tasks: {', '.join(meta.tasks)}")
             
             # List tools
-            tools = pod_config.get('tools', {}).get('enabled', [])
-            if tools:
-                print(f"   🔧 Tools: {', '.join(tools)}")
+            if meta.enabled_tools:
+                lines.append(f"   🔧 Tools: {', '.join(meta.enabled_tools)}")
             
             # Required inputs
-            required_inputs = [inp['name'] for inp in pod_config.get('inputs', {}).get('required', [])]
-            optional_inputs = [inp['name'] for inp in pod_config.get('inputs', {}).get('optional', [])]
-            
-            if required_inputs:
-                print(f"   📝 Required: {', '.join(required_inputs)}")
-            if optional_inputs:
-                print(f"   📝 Optional: {', '.join(optional_inputs)}")
+            if meta.required_inputs:
+                lines.append(f"   📝 Required: {', '.join(meta.required_inputs)}")
+            if meta.optional_inputs:
+                lines.append(f"   📝 Optional: {', '.join(meta.optional_inputs)}")
+        
+        print("\n".join(lines))
     
     def get_pod_info(self, pod_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific pod."""
         if pod_name not in self.pods:
             return None
         
-        pod = self.pods[pod_name]
+        meta = self.pods.meta(pod_name)
         return {
-            'name': pod.get('name', pod_name),
-            'description': pod.get('description', 'No description'),
-            'agents': list(pod.get('agents', {}).keys()),
-            'tasks': list(pod.get('tasks', {}).keys()),
-            'enabled_tools': pod.get('tools', {}).get('enabled', []),
-            'disabled_tools': pod.get('tools', {}).get('disabled', []),
-            'required_inputs': [inp['name'] for inp in pod.get('inputs', {}).get('required', [])],
-            'optional_inputs': [inp['name'] for inp in pod.get('inputs', {}).get('optional', [])]
+            'name': meta.name,
+            'description': meta.description,
+            'agents': list(meta.agents),
+            'tasks': list(meta.tasks),
+            'enabled_tools': list(meta.enabled_tools),
+            'disabled_tools': list(meta.disabled_tools),
+            'required_inputs': list(meta.required_inputs),
+            'optional_inputs': list(meta.optional_inputs)
         }
     
-    def create_llm(self, pod_config: Dict[str, Any]) -> LLM:
+    def get_pod_meta(self, pod_name: str) -> PodMeta:
+        """Get a pod's precomputed summary; unknown pods get an empty one."""
+        # Checked up front so a KeyError raised while building a real pod's summary isn't mistaken for "unknown"
+        if pod_name not in self.pods:
+            return _build_pod_meta(pod_name, {})
+        return self.pods.meta(pod_name)
+    
+    def create_llm(self, pod_config: Dict[str, Any]) -> 'LLM':
         """Create LLM instance from pod configuration."""
+        from crewai import LLM
+        
         llm_config = pod_config.get('llm', {})
         
-        # Set timeout environment variables for litellm
+        # Per-pod timeout goes straight to the LLM rather than process-wide env vars,
+        # so one pod's setting can't leak into another pod built in the same process
         timeout_seconds = llm_config.get('timeout', 1800)  # Default 30 minutes
-        os.environ['LITELLM_TIMEOUT'] = str(timeout_seconds)
-        os.environ['LITELLM_REQUEST_TIMEOUT'] = str(timeout_seconds)
         
         print(f"🕐 LLM timeout set to {timeout_seconds} seconds ({timeout_seconds//60} minutes)")
         
@@ -217,8 +541,10 @@ class OrcaPodLoader:
             timeout=timeout_seconds  # Set timeout directly on LLM
         )
     
-    def create_agents(self, pod_config: Dict[str, Any], llm: LLM) -> Dict[str, Agent]:
+    def create_agents(self, pod_config: Dict[str, Any], llm: 'LLM') -> Dict[str, 'Agent']:
         """Create agents from pod configuration."""
+        from crewai import Agent
+        
         agents = {}
         agent_configs = pod_config.get('agents', {})
         
@@ -242,8 +568,10 @@ class OrcaPodLoader:
         
         return agents
     
-    def create_tasks(self, pod_config: Dict[str, Any], agents: Dict[str, Agent]) -> List[Task]:
+    def create_tasks(self, pod_config: Dict[str, Any], agents: Dict[str, 'Agent']) -> List['Task']:
         """Create tasks from pod configuration."""
+        from crewai import Task
+        
         tasks = []
         task_configs = pod_config.get('tasks', {})
         workflow = pod_config.get('workflow', {})
@@ -272,7 +600,7 @@ class OrcaPodLoader:
         
         return tasks
     
-    def create_crew(self, pod_name: str) -> Optional[Crew]:
+    def create_crew(self, pod_name: str) -> Optional['Crew']:
         """Create a complete crew from pod configuration."""
         if pod_name not in self.pods:
             print(f"❌ Pod '{pod_name}' not found")
@@ -298,6 +626,7 @@ class OrcaPodLoader:
             return None
         
         # Create crew
+        from crewai import Crew
         workflow = pod_config.get('workflow', {})
         crew = Crew(
             agents=list(agents.values()),
@@ -309,11 +638,27 @@ class OrcaPodLoader:
         return crew
 
 
+_COMPLEXITY_EMOJI = {
+    "Simple": "🟢", "Moderate": "🟡",
+    "Complex": "🟠", "Ultra-Complex": "🔴"
+}
+
+_COMMAND_MENU = "\n".join([
+    "\nCommands:",
+    "  📝 'list' - Show available pods",
+    "  🕐 'timing <pod>' - Show detailed timing for specific pod",
+    "  🚀 'run <pod>' - Launch pod mission",
+    "  🚪 'exit' - Surface from depths"
+])
+
+
 class OrcaPodRunner:
     """Main runner for orchestrating orca pods."""
     
     def __init__(self, pods_dir: str = "pods", tools_config: str = "tools.yaml"):
         self.loader = OrcaPodLoader(pods_dir, tools_config)
+        # Built crews keyed by (pod name, config digest) so repeat runs skip the wiring
+        self._crew_cache: Dict[tuple, 'Crew'] = {}
     
     def list_available_pods(self):
         """List all available pods."""
@@ -326,25 +671,30 @@ class OrcaPodRunner:
     def run_pod(self, pod_name: str, inputs: Dict[str, Any] = None) -> Optional[Any]:
         """Run a specific pod with given inputs."""
         # Start timing
-        start_time = time.time()
+        start_time = time.monotonic()
         start_datetime = datetime.now()
         
         print(f"🐋 Pod diving into action: {pod_name}")
         print(f"🕐 Mission started at: {start_datetime.strftime('%H:%M:%S')}")
         
-        crew = self.loader.create_crew(pod_name)
+        crew = self._get_crew(pod_name)
         
         if not crew:
             return None
+        
+        # Each run gets the full shared search budget; custom_tools is only loaded if a pod uses it
+        custom_tools = sys.modules.get('custom_tools')
+        if custom_tools is not None:
+            custom_tools.reset_search_budget()
 
         try:
-            # Get pod configuration for timing estimates
-            pod_config = self.loader.pods.get(pod_name, {})
-            agents_count = len(pod_config.get('agents', {}))
-            tasks_count = len(pod_config.get('tasks', {}))
+            # Get pod summary for timing estimates
+            meta = self.loader.get_pod_meta(pod_name)
+            agents_count = len(meta.agents)
+            tasks_count = len(meta.tasks)
             
             # Estimate completion time based on complexity
-            estimated_minutes = self._estimate_completion_time(pod_config)
+            estimated_minutes = self._estimate_completion_time(meta)
             estimated_completion = start_datetime + timedelta(minutes=estimated_minutes)
             
             print(f"📊 Mission complexity: {agents_count} agents, {tasks_count} tasks")
@@ -356,7 +706,7 @@ class OrcaPodRunner:
             result = self._execute_with_progress_tracking(crew, inputs or {}, start_time, estimated_minutes)
             
             # Calculate final timing
-            end_time = time.time()
+            end_time = time.monotonic()
             total_duration = end_time - start_time
             end_datetime = datetime.now()
             
@@ -375,41 +725,50 @@ class OrcaPodRunner:
             return result
             
         except Exception as e:
-            end_time = time.time()
+            end_time = time.monotonic()
             duration = end_time - start_time
             print(f"❌ Pod mission failed after {self._format_duration(duration)}: {e}")
             return None
     
-    def _estimate_completion_time(self, pod_config: Dict[str, Any]) -> int:
-        """Estimate completion time in minutes based on pod complexity."""
-        agents_count = len(pod_config.get('agents', {}))
-        tasks_count = len(pod_config.get('tasks', {}))
-        enabled_tools = len(pod_config.get('tools', {}).get('enabled', []))
+    def _get_crew(self, pod_name: str) -> Optional['Crew']:
+        """Return a crew for the pod, reusing one built from an identical config."""
+        pod_config = self.loader.pods.get(pod_name)
+        if pod_config is None:
+            return self.loader.create_crew(pod_name)
+        
+        key = (pod_name, hashlib.sha256(repr(pod_config).encode('utf-8')).digest())
+        crew = self._crew_cache.get(key)
+        if crew is not None:
+            print(f"♻️  Reusing pod crew: {pod_config.get('name', pod_name)}")
+            return crew
         
-        # Base time per agent/task
-        base_time = 3  # 3 minutes per agent
-        tool_time = enabled_tools * 2  # 2 minutes per tool
-        complexity_multiplier = 1.2 if agents_count > 5 else 1.0
-        
-        estimated = (agents_count * base_time + tool_time) * complexity_multiplier
-        return max(5, int(estimated))  # Minimum 5 minutes
+        crew = self.loader.create_crew(pod_name)
+        if crew:
+            self._crew_cache[key] = crew
+        return crew
+    
+    def _estimate_completion_time(self, meta: PodMeta) -> int:
+        """Estimate completion time in minutes based on pod complexity."""
+        return meta.estimated_minutes
     
     def _execute_with_progress_tracking(self, crew, inputs: Dict[str, Any], start_time: float, estimated_minutes: int):
         """Execute crew with progress updates."""
-        import threading
-        import sys
+        # Carriage-return progress lines only make sense on a terminal; in logs
+        # and pipes they are just noise, so run the crew without the tracker
+        if not sys.stdout.isatty():
+            return crew.kickoff(inputs=inputs)
         
         result = None
         progress_thread = None
+        done = threading.Event()
         
         def progress_tracker():
             """Background thread to show progress updates."""
-            last_activity_message = time.time()
+            last_activity_message = time.monotonic()
             
             while True:
-                elapsed = time.time() - start_time
-                elapsed_minutes = elapsed / 60
-                current_time = datetime.now().strftime('%H:%M:%S')
+                now = time.monotonic()
+                elapsed_minutes = (now - start_time) / 60
                 
                 if elapsed_minutes < estimated_minutes:
                     progress = (elapsed_minutes / estimated_minutes) * 100
@@ -424,11 +783,14 @@ class OrcaPodRunner:
                     sys.stdout.flush()
                 
                 # Show activity message every 2 minutes
-                if time.time() - last_activity_message > 120:
+                if now - last_activity_message > 120:
+                    current_time = datetime.now().strftime('%H:%M:%S')
                     print(f"\n💭 [{current_time}] Agents still working... (using search tools and reasoning)")
-                    last_activity_message = time.time()
+                    last_activity_message = now
                 
-                time.sleep(30)  # Update every 30 seconds
+                # Update every 30 seconds, waking immediately once the crew is done
+                if done.wait(30):
+                    return
         
         try:
             # Start progress tracking
@@ -438,15 +800,15 @@ class OrcaPodRunner:
             # Execute the crew
             result = crew.kickoff(inputs=inputs)
             
-            # Clear progress line
-            sys.stdout.write("\r" + " " * 100 + "\r")
-            sys.stdout.flush()
+        finally:
+            # Stop the tracker before clearing its line so it can't redraw over the result
+            done.set()
+            if progress_thread is not None:
+                progress_thread.join(timeout=1)
             
-        except Exception as e:
             # Clear progress line
             sys.stdout.write("\r" + " " * 100 + "\r")
             sys.stdout.flush()
-            raise e
         
         return result
     
@@ -463,94 +825,114 @@ class OrcaPodRunner:
     
     def _get_crew_timing_info(self, pod_name: str) -> Dict[str, Any]:
         """Get timing information for debugging and optimization."""
-        pod_config = self.loader.pods.get(pod_name, {})
+        meta = self.loader.get_pod_meta(pod_name)
         
         timing_info = {
             'pod_name': pod_name,
-            'agents_count': len(pod_config.get('agents', {})),
-            'tasks_count': len(pod_config.get('tasks', {})),
-            'enabled_tools': list(pod_config.get('tools', {}).get('enabled', [])),
-            'timeout_seconds': pod_config.get('timeout', 1800),
-            'complexity_level': self._assess_complexity(pod_config)
+            'agents_count': len(meta.agents),
+            'tasks_count': len(meta.tasks),
+            'enabled_tools': list(meta.enabled_tools),
+            'timeout_seconds': meta.timeout,
+            'complexity_level': self._assess_complexity(meta)
         }
         
         return timing_info
     
-    def _assess_complexity(self, pod_config: Dict[str, Any]) -> str:
+    def _assess_complexity(self, meta: PodMeta) -> str:
         """Assess pod complexity level for timing predictions."""
-        agents_count = len(pod_config.get('agents', {}))
-        tools_count = len(pod_config.get('tools', {}).get('enabled', []))
-        
-        if agents_count == 1 and tools_count <= 2:
-            return "Simple"
-        elif agents_count <= 3 and tools_count <= 5:
-            return "Moderate"
-        elif agents_count <= 6 and tools_count <= 8:
-            return "Complex"
-        else:
-            return "Ultra-Complex"
+        return meta.complexity
     
     def show_timing_summary(self, pod_name: str = None):
         """Show timing information for pods."""
         if pod_name:
             timing_info = self._get_crew_timing_info(pod_name)
-            print(f"\n🐋 Pod Timing Analysis: {pod_name}")
-            print(f"   Agents: {timing_info['agents_count']}")
-            print(f"   Tasks: {timing_info['tasks_count']}")
-            print(f"   Tools: {len(timing_info['enabled_tools'])}")
-            print(f"   Timeout: {timing_info['timeout_seconds']}s ({timing_info['timeout_seconds']/60:.1f}min)")
-            print(f"   Complexity: {timing_info['complexity_level']}")
-            print(f"   Est. Runtime: {self._estimate_completion_time(self.loader.pods.get(pod_name, {}))} minutes")
+            print("\n".join([
+                f"\n🐋 Pod Timing Analysis: {pod_name}",
+                f"   Agents: {timing_info['agents_count']}",
+                f"   Tasks: {timing_info['tasks_count']}",
+                f"   Tools: {len(timing_info['enabled_tools'])}",
+                f"   Timeout: {timing_info['timeout_seconds']}s ({timing_info['timeout_seconds']/60:.1f}min)",
+                f"   Complexity: {timing_info['complexity_level']}",
+                f"   Est. Runtime: {self._estimate_completion_time(self.loader.get_pod_meta(pod_name))} minutes"
+            ]))
         else:
-            print("\n🐋 Available Pods Timing Overview:")
-            for pod in self.loader.pods.keys():
-                timing_info = self._get_crew_timing_info(pod)
-                complexity_emoji = {
-                    "Simple": "🟢", "Moderate": "🟡", 
-                    "Complex": "🟠", "Ultra-Complex": "🔴"
-                }.get(timing_info['complexity_level'], "⚪")
-                print(f"   {complexity_emoji} {pod}: {timing_info['agents_count']} agents, ~{self._estimate_completion_time(self.loader.pods.get(pod, {}))}min")
+            print(self._timing_overview())
+    
+    def _timing_overview(self) -> str:
+        """Render the one-line-per-pod timing overview."""
+        # Parse everything first so pods whose file fails to load drop out of the listing
+        self.loader.pods.load_all()
+        
+        lines = ["\n🐋 Available Pods Timing Overview:"]
+        for pod in self.loader.pods.keys():
+            timing_info = self._get_crew_timing_info(pod)
+            complexity_emoji = _COMPLEXITY_EMOJI.get(timing_info['complexity_level'], "⚪")
+            lines.append(f"   {complexity_emoji} {pod}: {timing_info['agents_count']} agents, ~{self._estimate_completion_time(self.loader.get_pod_meta(pod))}min")
+        return "\n".join(lines)
 
     def run_with_time_tracking(self):
         """Interactive mode with enhanced timing visibility."""
         print("🐋 Welcome to OrcAI Pod Command Center!")
         print("🕐 Enhanced with real-time mission tracking\n")
         
+        # verb -> (handler, whether it takes a pod name)
+        commands = {
+            'exit': (self._command_exit, False),
+            'list': (self._command_list, False),
+            'timing': (self._command_timing, True),
+            'run': (self._command_run, True)
+        }
+        
+        # Pod configs don't change during a session, so render the overview once
+        timing_overview = self._timing_overview()
+        
         while True:
             # Show timing overview
-            self.show_timing_summary()
+            print(timing_overview)
             
-            print("\nCommands:")
-            print("  📝 'list' - Show available pods")
-            print("  🕐 'timing <pod>' - Show detailed timing for specific pod")
-            print("  🚀 'run <pod>' - Launch pod mission")
-            print("  🚪 'exit' - Surface from depths")
+            print(_COMMAND_MENU)
             
             command = input("\n🐋 Captain's orders: ").strip().lower()
             
-            if command == 'exit':
-                print("🌊 Surfacing... Safe travels, Captain!")
-                break
-            elif command == 'list':
-                self.loader.list_pods()
-            elif command.startswith('timing '):
-                pod_name = command[7:].strip()
-                if pod_name in self.loader.pods.keys():
-                    self.show_timing_summary(pod_name)
-                else:
-                    print(f"❌ Pod '{pod_name}' not found in fleet!")
-            elif command.startswith('run '):
-                pod_name = command[4:].strip()
-                if pod_name in self.loader.pods.keys():
-                    print(f"\n🚀 Launching {pod_name} mission...")
-                    result = self.run_pod(pod_name)
-                    if result:
-                        print(f"\n📋 Mission Report:")
-                        print(result)
-                else:
-                    print(f"❌ Pod '{pod_name}' not found in fleet!")
-            else:
+            # Commands are a verb plus an optional pod name argument
+            verb, _, argument = command.partition(' ')
+            argument = argument.strip()
+            handler, takes_argument = commands.get(verb, (None, False))
+            
+            if handler is None or takes_argument != bool(argument):
                 print("❓ Unknown command. Try 'list', 'timing <pod>', 'run <pod>', or 'exit'")
+            elif takes_argument:
+                handler(argument)
+            elif handler():
+                break
+    
+    def _command_exit(self) -> bool:
+        """Leave the interactive command center."""
+        print("🌊 Surfacing... Safe travels, Captain!")
+        return True
+    
+    def _command_list(self) -> bool:
+        """Show the available pods."""
+        self.loader.list_pods()
+        return False
+    
+    def _command_timing(self, pod_name: str):
+        """Show detailed timing for a pod."""
+        if pod_name in self.loader.pods:
+            self.show_timing_summary(pod_name)
+        else:
+            print(f"❌ Pod '{pod_name}' not found in fleet!")
+    
+    def _command_run(self, pod_name: str):
+        """Launch a pod mission and print its report."""
+        if pod_name in self.loader.pods:
+            print(f"\n🚀 Launching {pod_name} mission...")
+            result = self.run_pod(pod_name)
+            if result:
+                print(f"\n📋 Mission Report:")
+                print(result)
+        else:
+            print(f"❌ Pod '{pod_name}' not found in fleet!")
 
 
 # Example usage and testing functions
@@ -3,25 +3,22 @@
 OrcasAI Pod CLI - Command Line Interface for Orca Pod Management
 
 The perfect coordination tool for your orca pods - groups of AI agents
-wor                except ValueError:
-                    print("❌ Invalid input. Please enter a number.")
-            
-            elif choice == "4":
-                print("🌊 Returning to surface... Goodbye!")
-                breakher with the intelligence and teamwork of real orcas.
+working together with the intelligence and teamwork of real orcas.
 
 Usage:
-    python orcasai.py list [--pods-dir=<dir>]                    # List all available pods
-    python orcasai.py info <pod_name> [--pods-dir=<dir>]         # Get detailed info about a pod
+    python orcasai.py list [--pods-dir=<dir>] [--json]           # List all available pods
+    python orcasai.py info <pod_name> [--pods-dir=<dir>] [--json] # Get detailed info about a pod
     python orcasai.py run <pod_name> [options]                   # Run a pod
     python orcasai.py interactive [--pods-dir=<dir>]             # Interactive mode
 
 Options:
     --pods-dir=<dir>     Directory containing pod YAML files (default: pods)
     --tools-config=<f>   Tools configuration file (default: tools.yaml)
+    --no-pod-cache       Re-parse pod and tools YAML instead of using the parse cache
     --topic=<topic>      Topic for content/research pods
     --project=<project>  Project description for development pods
     --input KEY VALUE    Additional input key-value pairs (can be used multiple times)
+    --json               Print list/info output as JSON (status messages go to stderr)
 
 Examples:
     python orcasai.py list
@@ -34,23 +31,63 @@ Examples:
 """
 
 import argparse
+import contextlib
+import functools
+import json
+import re
 import sys
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 # Set global timeouts for all LLM operations
 os.environ['LITELLM_TIMEOUT'] = '2400'  # 40 minutes
 os.environ['LITELLM_REQUEST_TIMEOUT'] = '2400'
 os.environ['OPENAI_TIMEOUT'] = '2400'
 
-from orca_pod_runner import OrcaPodRunner
+# A {name} placeholder in an output file naming pattern
+_FILENAME_PLACEHOLDER = re.compile(r'\{([^{}]+)\}')
+
+# Anything str.isalnum() rejects, other than '_', '-' and '.'
+_FILENAME_UNSAFE_CHARS = re.compile(r'[^\w.-]')
+
+
+# Interactive mode line editing
+_INTERACTIVE_COMMANDS = ('list', 'timing', 'run', 'exit')
+# Kept with the rest of OrcasAI's per-user state (YAML and search caches)
+_HISTORY_FILE = Path.home() / '.cache' / 'orkasai' / 'history'
+_HISTORY_LENGTH = 1000
+
+
+def _save_history(history_file: Path):
+    """Persist the interactive session's readline history."""
+    import readline
+    
+    try:
+        history_file.parent.mkdir(parents=True, exist_ok=True)
+        readline.write_history_file(str(history_file))
+    except OSError as e:
+        print(f"⚠️  Could not save command history: {e}")
+
+
+@functools.lru_cache(maxsize=64)
+def _build_output_guidelines(style_guidelines: Tuple[str, ...]) -> str:
+    """Render a pod's style guidelines into the prompt block agents receive."""
+    guidelines_text = "\n".join([f"- {guideline}" for guideline in style_guidelines])
+    return f"""
+IMPORTANT OUTPUT REQUIREMENTS:
+{guidelines_text}
+
+Please follow these guidelines strictly in all your responses.
+"""
 
 
 class OrcaCLI:
     """Command Line Interface for Orca Pods - The Pod Commander."""
     
     def __init__(self, pods_dir: str = "pods", tools_config: str = "tools.yaml"):
+        # Imported here so --help and usage errors don't load the pod runtime
+        from orca_pod_runner import OrcaPodRunner
         self.runner = OrcaPodRunner(pods_dir, tools_config)
     
     def list_pods(self):
@@ -65,36 +102,50 @@ class OrcaCLI:
             print(f"❌ Pod '{pod_name}' not found.")
             return
         
-        print(f"\n🐋 Pod: {info['name']}")
-        print("=" * 60)
-        print(f"📝 Mission: {info['description']}")
-        
-        print(f"\n� Orcas in this pod ({len(info['agents'])}):")
-        for agent in info['agents']:
-            print(f"   • {agent}")
+        # Collect the whole report and write it in one go
+        lines = [
+            f"\n🐋 Pod: {info['name']}",
+            "=" * 60,
+            f"📝 Mission: {info['description']}",
+            f"\n� Orcas in this pod ({len(info['agents'])}):"
+        ]
+        lines.extend(f"   • {agent}" for agent in info['agents'])
         
-        print(f"\n📋 Coordinated Tasks ({len(info['tasks'])}):")
-        for task in info['tasks']:
-            print(f"   • {task}")
+        lines.append(f"\n📋 Coordinated Tasks ({len(info['tasks'])}):")
+        lines.extend(f"   • {task}" for task in info['tasks'])
         
-        print(f"\n🔧 Available Tools ({len(info['enabled_tools'])}):")
-        for tool in info['enabled_tools']:
-            print(f"   • {tool}")
+        lines.append(f"\n🔧 Available Tools ({len(info['enabled_tools'])}):")
+        lines.extend(f"   • {tool}" for tool in info['enabled_tools'])
         
         if info['disabled_tools']:
-            print(f"\n🚫 Disabled Tools ({len(info['disabled_tools'])}):")
-            for tool in info['disabled_tools']:
-                print(f"   • {tool}")
+            lines.append(f"\n🚫 Disabled Tools ({len(info['disabled_tools'])}):")
+            lines.extend(f"   • {tool}" for tool in info['disabled_tools'])
         
         if info['required_inputs']:
-            print(f"\n📝 Required Inputs:")
-            for inp in info['required_inputs']:
-                print(f"   • {inp}")
+            lines.append(f"\n📝 Required Inputs:")
+            lines.extend(f"   • {inp}" for inp in info['required_inputs'])
         
         if info['optional_inputs']:
-            print(f"\n📝 Optional Inputs:")
-            for inp in info['optional_inputs']:
-                print(f"   • {inp}")
+            lines.append(f"\n📝 Optional Inputs:")
+            lines.extend(f"   • {inp}" for inp in info['optional_inputs'])
+        
+        print("\n".join(lines))
+    
+    def pods_data(self) -> List[Dict[str, Any]]:
+        """Collect information about every pod for machine-readable output."""
+        loader = self.runner.loader
+        loader.pods.load_all()
+        return [dict(pod=pod_name, **loader.get_pod_info(pod_name)) for pod_name in loader.pods]
+    
+    def pod_data(self, pod_name: str) -> Optional[Dict[str, Any]]:
+        """Collect information about a single pod for machine-readable output."""
+        info = self.runner.loader.get_pod_info(pod_name)
+        
+        if not info:
+            print(f"❌ Pod '{pod_name}' not found.")
+            return None
+        
+        return dict(pod=pod_name, **info)
     
     def run_pod(self, pod_name: str, inputs: Dict[str, Any] = None):
         """Run a specific pod."""
@@ -117,13 +168,7 @@ class OrcaCLI:
             style_guidelines = output_config.get('style_guidelines', [])
             
             if style_guidelines:
-                guidelines_text = "\n".join([f"- {guideline}" for guideline in style_guidelines])
-                inputs['_output_guidelines'] = f"""
-IMPORTANT OUTPUT REQUIREMENTS:
-{guidelines_text}
-
-Please follow these guidelines strictly in all your responses.
-"""
+                inputs['_output_guidelines'] = _build_output_guidelines(tuple(map(str, style_guidelines)))
         
         print(f"\n🐋 Deploying pod: {pod_name}")
         if inputs:
@@ -168,9 +213,12 @@ Please follow these guidelines strictly in all your responses.
             # Format content based on configuration
             content = self._format_output_content(result.raw, output_config, pod_config)
             
-            # Save file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Save file, encoded once and written in a single call; text mode's
+            # newline translation is kept by converting to the platform's line endings
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            with open(filepath, 'wb') as f:
+                f.write(content.encode('utf-8'))
             
             print(f"\n💾 Results saved to: {filepath}")
             
@@ -181,39 +229,34 @@ Please follow these guidelines strictly in all your responses.
         """Generate filename from naming pattern and inputs."""
         from datetime import datetime
         
-        # Start with the pattern
-        filename = naming_pattern
+        # Input placeholders, skipping internal variables, with values cleaned for filenames
+        substitutions = {
+            key: str(value).replace(' ', '_').replace('/', '_')[:50]
+            for key, value in inputs.items()
+            if not key.startswith('_')
+        }
         
-        # Replace common placeholders
-        filename = filename.replace('{pod_name}', pod_name)
-        filename = filename.replace('{timestamp}', datetime.now().strftime('%Y%m%d_%H%M%S'))
+        # Common placeholders take precedence over inputs of the same name
+        substitutions['pod_name'] = pod_name
+        substitutions['timestamp'] = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Replace input placeholders
-        for key, value in inputs.items():
-            if not key.startswith('_'):  # Skip internal variables
-                # Clean value for filename
-                clean_value = str(value).replace(' ', '_').replace('/', '_')[:50]
-                filename = filename.replace(f'{{{key}}}', clean_value)
+        # Fill every placeholder in one pass; unknown ones are left for the cleanup below
+        filename = _FILENAME_PLACEHOLDER.sub(
+            lambda match: substitutions.get(match.group(1), match.group(0)),
+            naming_pattern
+        )
         
         # Clean up any remaining brackets and invalid characters
-        filename = filename.replace('{', '').replace('}', '')
-        filename = ''.join(c for c in filename if c.isalnum() or c in '_-.')
+        filename = _FILENAME_UNSAFE_CHARS.sub('', filename)
         
         return filename
     
     def _format_output_content(self, raw_content: str, output_config: Dict[str, Any], pod_config: Dict[str, Any]) -> str:
         """Format output content based on configuration."""
-        content_parts = []
-        
-        # Add header
         pod_name = pod_config.get('name', 'Pod Results')
-        content_parts.append(f"# {pod_name}")
-        content_parts.append(f"*Generated by OrcasAI*\n")
         
-        # Add the raw content directly
-        content_parts.append(raw_content)
-        
-        return "\n".join(content_parts)
+        # Header followed by the raw content
+        return f"# {pod_name}\n*Generated by OrcasAI*\n\n{raw_content}"
     
     def interactive_mode(self):
         """Interactive mode for running pods."""
@@ -228,8 +271,46 @@ Please follow these guidelines strictly in all your responses.
                 os.environ['SERPER_API_KEY'] = serper_key
                 print("✅ Serper API key set for this session")
         
-        # Use the enhanced timing interface
-        self.runner.run_with_time_tracking()
+        # Set up history and completion after the API key prompt so the key never lands in the history file
+        history_file = self._enable_line_editing()
+        
+        try:
+            # Use the enhanced timing interface
+            self.runner.run_with_time_tracking()
+        finally:
+            if history_file:
+                _save_history(history_file)
+    
+    def _enable_line_editing(self) -> Optional[Path]:
+        """Turn on readline history and tab completion of commands and pod names."""
+        try:
+            import readline
+        except ImportError:
+            # Not available on Windows without pyreadline; fall back to plain input()
+            return None
+        
+        pod_names = sorted(self.runner.loader.pods)
+        
+        def complete(text: str, state: int) -> Optional[str]:
+            # The first word is a command, anything after it is a pod name
+            if ' ' in readline.get_line_buffer()[:readline.get_begidx()]:
+                candidates = pod_names
+            else:
+                candidates = _INTERACTIVE_COMMANDS
+            matches = [name for name in candidates if name.startswith(text)]
+            return matches[state] if state < len(matches) else None
+        
+        readline.set_completer(complete)
+        readline.parse_and_bind('tab: complete')
+        
+        history_file = _HISTORY_FILE
+        try:
+            readline.read_history_file(str(history_file))
+        except OSError:
+            pass  # No history yet
+        readline.set_history_length(_HISTORY_LENGTH)
+        
+        return history_file
     
     def _get_pod_inputs(self, pod_name: str) -> Dict[str, Any]:
         """Get inputs for a specific pod interactively."""
@@ -276,6 +357,52 @@ Please follow these guidelines strictly in all your responses.
         return inputs
 
 
+class _InputAction(argparse.Action):
+    """Collect repeated --input KEY VALUE pairs straight into a dict."""
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        inputs = getattr(namespace, self.dest, None)
+        if inputs is None:
+            inputs = {}
+            setattr(namespace, self.dest, inputs)
+        
+        key, value = values
+        inputs[key] = value
+
+
+def _handle_list(cli: OrcaCLI, args: argparse.Namespace) -> Optional[List[Dict[str, Any]]]:
+    """Handle the 'list' command; returns the data to print in JSON mode."""
+    if args.json:
+        return cli.pods_data()
+    cli.list_pods()
+
+
+def _handle_info(cli: OrcaCLI, args: argparse.Namespace) -> Optional[Dict[str, Any]]:
+    """Handle the 'info' command; returns the data to print in JSON mode."""
+    if args.json:
+        return cli.pod_data(args.pod_name)
+    cli.pod_info(args.pod_name)
+
+
+def _handle_run(cli: OrcaCLI, args: argparse.Namespace):
+    """Handle the 'run' command."""
+    inputs = {}
+    
+    if args.topic:
+        inputs['topic'] = args.topic
+    if args.project:
+        inputs['project'] = args.project
+    if args.input:
+        inputs.update(args.input)
+    
+    cli.run_pod(args.pod_name, inputs)
+
+
+def _handle_interactive(cli: OrcaCLI, args: argparse.Namespace):
+    """Handle the 'interactive' command."""
+    cli.interactive_mode()
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -289,38 +416,49 @@ def main():
                        help='Directory containing pod YAML files (default: pods)')
     parser.add_argument('--tools-config', default='tools.yaml',
                        help='Tools configuration file (default: tools.yaml)')
+    parser.add_argument('--no-pod-cache', action='store_true',
+                       help='Re-parse pod and tools YAML instead of using the parse cache')
+    
+    # API key and output flags only exist on some commands; give every command the same defaults
+    parser.set_defaults(serper_api_key=None, openai_api_key=None, json=False)
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # List command
-    subparsers.add_parser('list', help='List all available pods')
+    list_parser = subparsers.add_parser('list', help='List all available pods')
+    list_parser.add_argument('--json', action='store_true', help='Print the pods as JSON')
+    list_parser.set_defaults(handler=_handle_list)
     
     # Info command
     info_parser = subparsers.add_parser('info', help='Show pod information')
     info_parser.add_argument('pod_name', help='Name of the pod')
+    info_parser.add_argument('--json', action='store_true', help='Print the pod information as JSON')
+    info_parser.set_defaults(handler=_handle_info)
     
     # Run command
     run_parser = subparsers.add_parser('run', help='Deploy a pod on mission')
     run_parser.add_argument('pod_name', help='Name of the pod to deploy')
     run_parser.add_argument('--topic', help='Topic for content/research pods')
     run_parser.add_argument('--project', help='Project description for development pods')
-    run_parser.add_argument('--input', action='append', nargs=2, metavar=('KEY', 'VALUE'),
+    run_parser.add_argument('--input', action=_InputAction, nargs=2, metavar=('KEY', 'VALUE'),
                            help='Additional input key-value pairs (can be used multiple times)')
     run_parser.add_argument('--serper-api-key', help='Serper API key for search functionality')
     run_parser.add_argument('--openai-api-key', help='OpenAI API key (optional)')
+    run_parser.set_defaults(handler=_handle_run)
     
     # Interactive command
     interactive_parser = subparsers.add_parser('interactive', help='Run in interactive mode')
     interactive_parser.add_argument('--serper-api-key', help='Serper API key for search functionality')
     interactive_parser.add_argument('--openai-api-key', help='OpenAI API key (optional)')
+    interactive_parser.set_defaults(handler=_handle_interactive)
     
     args = parser.parse_args()
     
     # Set API keys as environment variables if provided
-    if hasattr(args, 'serper_api_key') and args.serper_api_key:
+    if args.serper_api_key:
         os.environ['SERPER_API_KEY'] = args.serper_api_key
         print("✅ Serper API key set from command line")
-    if hasattr(args, 'openai_api_key') and args.openai_api_key:
+    if args.openai_api_key:
         os.environ['OPENAI_API_KEY'] = args.openai_api_key
         print("✅ OpenAI API key set from command line")
     
@@ -328,36 +466,30 @@ def main():
         parser.print_help()
         return
     
-    cli = OrcaCLI(args.pods_dir, args.tools_config)
+    # With --json, status messages go to stderr so stdout carries only the JSON document
+    result = None
     
-    try:
-        if args.command == 'list':
-            cli.list_pods()
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        # Inside the redirect: importing the runner can print notices of its own
+        if args.no_pod_cache:
+            from orca_pod_runner import disable_yaml_cache
+            disable_yaml_cache()
         
-        elif args.command == 'info':
-            cli.pod_info(args.pod_name)
+        cli = OrcaCLI(args.pods_dir, args.tools_config)
         
-        elif args.command == 'run':
-            inputs = {}
-            
-            if args.topic:
-                inputs['topic'] = args.topic
-            if args.project:
-                inputs['project'] = args.project
-            if args.input:
-                for key, value in args.input:
-                    inputs[key] = value
-            
-            cli.run_pod(args.pod_name, inputs)
+        try:
+            result = args.handler(cli, args)
         
-        elif args.command == 'interactive':
-            cli.interactive_mode()
+        except KeyboardInterrupt:
+            print("\n\n� Mission interrupted by commander. Returning to surface!")
+        except Exception as e:
+            print(f"\n❌ Critical system error: {e}")
+            sys.exit(1)
     
-    except KeyboardInterrupt:
-        print("\n\n� Mission interrupted by commander. Returning to surface!")
-    except Exception as e:
-        print(f"\n❌ Critical system error: {e}")
-        sys.exit(1)
+    if args.json:
+        if result is None:
+            sys.exit(1)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
 
 
 if __name__ == "__main__":
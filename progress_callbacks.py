@@ -3,78 +3,164 @@ Progress tracking callbacks for CrewAI agents
 """
 
 from crewai.agent import BaseCallbackHandler
-from datetime import datetime
+from collections import OrderedDict
+from typing import Optional
+import os
+import sys
 import time
 
+# Agents/tasks whose start time is kept while waiting for them to finish; ones that
+# never report back (e.g. after an error) are evicted oldest-first beyond this
+_MAX_TRACKED_STARTS = 512
+
+# (second, HH:MM:SS text) of the last formatted timestamp; swapped as one
+# tuple so concurrent callbacks never see a second paired with another's text
+_cached_timestamp = (None, '')
+
+
+def _now_hms() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second."""
+    global _cached_timestamp
+    
+    now = time.time()
+    second = int(now)
+    cached_second, text = _cached_timestamp
+    if second != cached_second:
+        text = time.strftime('%H:%M:%S', time.localtime(now))
+        _cached_timestamp = (second, text)
+    return text
+
+
+def _stdout_is_terminal() -> bool:
+    """Check whether stdout is an interactive terminal."""
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        # No stdout (pythonw) or it has been closed
+        return False
+
+
+def _record_start(start_times: OrderedDict, key, now: float):
+    """Remember a start time, evicting the oldest entry once the table is full."""
+    start_times[key] = now
+    start_times.move_to_end(key)
+    if len(start_times) > _MAX_TRACKED_STARTS:
+        start_times.popitem(last=False)
+
 
 class VerboseProgressCallback(BaseCallbackHandler):
-    """Callback to show detailed progress during agent execution"""
+    """Callback to show detailed progress during agent execution
+
+    By default it only prints when stdout is a terminal; set ORKAS_VERBOSE=1
+    to keep the output when it is piped or redirected.
+    """
     
-    def __init__(self):
-        self.start_time = time.time()
-        self.agent_start_times = {}
-        self.task_start_times = {}
+    __slots__ = ('enabled', 'start_time', 'agent_start_times', 'task_start_times')
+    
+    def __init__(self, enabled: Optional[bool] = None):
+        # When disabled, every handler returns before doing any formatting
+        if enabled is None:
+            enabled = _stdout_is_terminal() or os.environ.get('ORKAS_VERBOSE') == '1'
+        self.enabled = enabled
+        # Durations use the monotonic clock; wall-clock time is only for display
+        self.start_time = time.monotonic()
+        self.agent_start_times = OrderedDict()
+        self.task_start_times = OrderedDict()
     
     def on_agent_start(self, agent, task):
         """Called when an agent starts working on a task"""
-        current_time = datetime.now().strftime('%H:%M:%S')
-        elapsed = time.time() - self.start_time
-        self.agent_start_times[agent.role] = time.time()
+        if not self.enabled:
+            return
+        
+        now = time.monotonic()
+        current_time = _now_hms()
+        elapsed = now - self.start_time
+        _record_start(self.agent_start_times, agent.role, now)
         
-        print(f"\n🤖 [{current_time}] Agent '{agent.role}' started working")
-        print(f"📋 Task: {task.description[:100]}...")
-        print(f"⏱️  Elapsed: {elapsed:.1f}s")
+        print("\n".join([
+            f"\n🤖 [{current_time}] Agent '{agent.role}' started working",
+            f"📋 Task: {task.description[:100]}...",
+            f"⏱️  Elapsed: {elapsed:.1f}s"
+        ]))
     
     def on_agent_finish(self, agent, result):
         """Called when an agent finishes"""
-        current_time = datetime.now().strftime('%H:%M:%S')
-        agent_duration = time.time() - self.agent_start_times.get(agent.role, time.time())
+        if not self.enabled:
+            return
         
-        print(f"\n✅ [{current_time}] Agent '{agent.role}' completed task")
-        print(f"⏱️  Agent duration: {agent_duration:.1f}s")
-        print(f"📝 Result length: {len(str(result))} characters")
+        now = time.monotonic()
+        current_time = _now_hms()
+        agent_duration = now - self.agent_start_times.pop(agent.role, now)
+        
+        print("\n".join([
+            f"\n✅ [{current_time}] Agent '{agent.role}' completed task",
+            f"⏱️  Agent duration: {agent_duration:.1f}s",
+            f"📝 Result length: {len(str(result))} characters"
+        ]))
     
     def on_tool_start(self, tool, input_data):
         """Called when a tool is used"""
-        current_time = datetime.now().strftime('%H:%M:%S')
-        print(f"\n🔧 [{current_time}] Using tool: {tool}")
-        print(f"📥 Input: {str(input_data)[:150]}...")
+        if not self.enabled:
+            return
+        
+        current_time = _now_hms()
+        print("\n".join([
+            f"\n🔧 [{current_time}] Using tool: {tool}",
+            f"📥 Input: {str(input_data)[:150]}..."
+        ]))
     
     def on_tool_end(self, tool, output):
         """Called when a tool finishes"""
-        current_time = datetime.now().strftime('%H:%M:%S')
-        print(f"✅ [{current_time}] Tool '{tool}' completed")
-        print(f"📤 Output length: {len(str(output))} characters")
+        if not self.enabled:
+            return
+        
+        current_time = _now_hms()
+        print("\n".join([
+            f"✅ [{current_time}] Tool '{tool}' completed",
+            f"📤 Output length: {len(str(output))} characters"
+        ]))
     
     def on_task_start(self, task):
         """Called when a task starts"""
-        current_time = datetime.now().strftime('%H:%M:%S')
-        self.task_start_times[task.description[:50]] = time.time()
+        if not self.enabled:
+            return
+        
+        now = time.monotonic()
+        current_time = _now_hms()
+        # Keyed by object identity; popped again when the task completes
+        _record_start(self.task_start_times, id(task), now)
         print(f"\n📋 [{current_time}] Starting task: {task.description[:100]}...")
     
     def on_task_complete(self, task, result):
         """Called when a task completes"""
-        current_time = datetime.now().strftime('%H:%M:%S')
-        task_key = task.description[:50]
-        task_duration = time.time() - self.task_start_times.get(task_key, time.time())
+        if not self.enabled:
+            return
         
-        print(f"\n🎯 [{current_time}] Task completed!")
-        print(f"⏱️  Task duration: {task_duration:.1f}s")
-        print(f"📄 Result preview: {str(result)[:200]}...")
+        now = time.monotonic()
+        current_time = _now_hms()
+        task_duration = now - self.task_start_times.pop(id(task), now)
+        
+        print("\n".join([
+            f"\n🎯 [{current_time}] Task completed!",
+            f"⏱️  Task duration: {task_duration:.1f}s",
+            f"📄 Result preview: {str(result)[:200]}..."
+        ]))
 
 
 class SimpleProgressCallback:
     """Simple progress indicator"""
     
+    __slots__ = ('start_time', 'last_update')
+    
     def __init__(self):
-        self.start_time = time.time()
-        self.last_update = time.time()
+        self.start_time = time.monotonic()
+        self.last_update = self.start_time
     
     def show_progress(self):
         """Show a simple progress indicator"""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_update > 30:  # Update every 30 seconds
             elapsed = current_time - self.start_time
-            timestamp = datetime.now().strftime('%H:%M:%S')
+            timestamp = _now_hms()
             print(f"⏳ [{timestamp}] Still working... (elapsed: {elapsed:.0f}s)")
             self.last_update = current_time